@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+DailyLog 메모리/DB 크기 측정 - 합성 일기(기본 100,000일)로 before/after 비교
+  python bench_memory.py [--days 100000] [--months 12]
+
+- DB 크기: 일반 TEXT 저장 vs 오래된 항목 zlib 압축(compress_archived) 후
+- 행 로드 RSS: fetchall 튜플(이전 get_all) vs EntryRow 레코드 (일반 DB / 압축 DB)
+- 내보내기 RSS: 튜플 + dict 리스트 + DataFrame(이전 _to_dataframe) vs EntryRow + DataFrame.from_records
+각 RSS 측정은 별도 프로세스에서 실행하고, 같은 단계끼리만 비교합니다.
+"""
+
+import sys, os, random, sqlite3, subprocess, tempfile, argparse, gc
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import main
+
+WORDS = ["김밥", "된장찌개", "한강", "러닝 5km", "스쿼트", "소설", "회의", "삼성전자", "NVDA", "키움증권", "배당", "날씨 맑음", "산책로", "독서 모임"]
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().rss
+        except ImportError:
+            import resource
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # 최대치 (근사)
+
+def build(db_path, days):
+    rnd = random.Random(42)
+    conn = sqlite3.connect(db_path)
+    main.DailyLogDB(db_path).close()  # 스키마 생성
+    start = date.today() - timedelta(days=days)
+    rows = []
+    for i in range(days):
+        iso = (start + timedelta(days=i)).isoformat()
+        log = "\n".join(f"{e} {n}: {' '.join(rnd.choices(WORDS, k=6))}" for e, n in main.ACTIVITY_CHIPS)
+        rows.append((iso, main.date_label_of(iso), log,
+                     f"📈 매수: {rnd.choice(WORDS)} {rnd.randint(1, 50)}주",
+                     "🏦 대신증권: 삼성전자 10 | 🏦 키움증권: NVDA 3 | 🏦 키움 ISA: 배당ETF 20",
+                     "🔎 메모: " + " ".join(rnd.choices(WORDS, k=20)),
+                     f"✅ 관심주 {rnd.choice(WORDS)}, {rnd.choice(WORDS)} ⭐ {rnd.choice(WORDS)}",
+                     "2020-01-01 00:00:00"))
+    conn.executemany("INSERT INTO entries VALUES(?,?,?,?,?,?,?,?)", rows); conn.commit(); conn.close()
+    main.DailyLogDB(db_path).close()  # 파생 인덱스 생성 (실제 DB와 같은 구성)
+    conn = sqlite3.connect(db_path); conn.execute("VACUUM"); conn.close()
+
+def measure(mode, db_path):
+    if mode.startswith("export"): import pandas  # 모듈 로드/연결 비용은 기준선에 포함
+    old = mode in ("tuples", "export_dicts")
+    db = sqlite3.connect(db_path) if old else main.DailyLogDB(db_path)
+    gc.collect(); base = rss_bytes()
+    if old:
+        # 이전 get_all(): fetchall 튜플
+        rows = db.execute(f"SELECT {main.ENTRY_COLS} FROM entries ORDER BY date_iso DESC").fetchall()
+    else:
+        rows = db.get_all()
+    n = len(rows)
+    if mode == "export_dicts":
+        # 이전 _to_dataframe: dict 리스트를 거쳐 DataFrame
+        import pandas as pd
+        data = [{"날짜": r[1], "Daily Log": r[2], "주식 거래내역": r[3], "남은 주식 수(증권사별)": r[4],
+                 "주식 고려사항": r[5], "관심 주": r[6]} for r in rows]
+        df = pd.DataFrame(data, columns=main.HEADERS)
+    elif mode == "export_records":
+        import pandas as pd
+        df = pd.DataFrame.from_records((r[1:] for r in rows), columns=main.HEADERS)
+    gc.collect()
+    print(n, rss_bytes() - base)
+
+def run_child(mode, db_path):
+    out = subprocess.run([sys.executable, __file__, "--child", mode, db_path], capture_output=True, text=True, check=True).stdout
+    n, delta = out.split()
+    return int(n), int(delta)
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=100_000)
+    ap.add_argument("--months", type=int, default=main.ARCHIVE_AFTER_MONTHS)
+    ap.add_argument("--child", nargs=2)
+    args = ap.parse_args()
+    if args.child:
+        measure(*args.child); sys.exit(0)
+
+    tmp = tempfile.mkdtemp(prefix="dailylog_bench_")
+    plain, packed = os.path.join(tmp, "plain.db"), os.path.join(tmp, "packed.db")
+    print(f"합성 일기 {args.days:,}일 생성 중... ({tmp})", flush=True)
+    build(plain, args.days)
+    with open(plain, "rb") as src, open(packed, "wb") as dst: dst.write(src.read())
+    db = main.DailyLogDB(packed); n = db.compress_archived(args.months); db.close()
+
+    mb = lambda b: f"{b / 1048576:8.1f} MB"
+    print(f"\n[DB 크기]  압축 대상 {n:,}일 ({args.months}개월 이전)")
+    print(f"  일반 TEXT         {mb(os.path.getsize(plain))}")
+    print(f"  오래된 항목 압축  {mb(os.path.getsize(packed))}")
+    for title, cases in [
+        ("전체 행 로드 RSS 증가분", [("튜플 (이전)", "tuples", plain), ("EntryRow / 일반 DB", "rows", plain),
+                                    ("EntryRow / 압축 DB", "rows", packed)]),
+        ("내보내기(행 + DataFrame) RSS 증가분", [("튜플 + dict + DataFrame (이전)", "export_dicts", plain),
+                                                ("EntryRow + from_records", "export_records", plain)])]:
+        print(f"\n[{title}]")
+        for label, mode, path in cases:
+            rows, delta = run_child(mode, path)
+            print(f"  {label:<30} {mb(delta)}  ({rows:,}행)")
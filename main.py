@@ -5,18 +5,28 @@ DailyLog Desktop - PySide6 (버튼 가시성/스타일 및 메뉴 토글 수정
 - 보기 → 좌측 뷰 전환: 실제로 토글되도록 `toggled` 시그널 연결
 """
 
-import sys, os, sqlite3
-from datetime import datetime, date
+import sys, os, re, zlib, hashlib, sqlite3, json, queue, asyncio, argparse
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
+from urllib.parse import urlsplit, parse_qs
+from urllib.request import pathname2url
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFileDialog, QMessageBox,
     QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QSplitter, QGroupBox, QCheckBox,
+    QTableView, QTableWidget, QTableWidgetItem, QHeaderView, QSplitter, QGroupBox, QCheckBox, QComboBox,
     QDateEdit, QStyledItemDelegate, QAbstractItemView, QStyle, QStatusBar,
-    QGraphicsDropShadowEffect, QCalendarWidget, QStackedWidget
+    QGraphicsDropShadowEffect, QCalendarWidget, QStackedWidget, QDialog, QDialogButtonBox, QToolTip, QDockWidget
+)
+from PySide6.QtCore import (
+    Qt, QDate, QRectF, QSize, QSizeF, QUrl, QAbstractTableModel, QModelIndex, Signal, QTimer, QFileSystemWatcher,
+    QObject, QRunnable, QThreadPool, QMarginsF
+)
+from PySide6.QtGui import (
+    QTextDocument, QIcon, QPixmap, QAction, QDesktopServices, QPalette, QColor, QTextCharFormat, QPainter,
+    QGuiApplication, QPdfWriter, QPageSize, QPageLayout
 )
-from PySide6.QtCore import Qt, QDate, QRectF, QSize, QUrl
-from PySide6.QtGui import QTextDocument, QIcon, QPixmap, QAction, QDesktopServices, QPalette, QColor, QTextCharFormat
 
 # ===== Brand Settings =====
 BRAND_PRIMARY = "#3B82F6"
@@ -25,6 +35,17 @@ FONT_FAMILY   = "Noto Sans KR"
 FONT_SIZE_PT  = 10
 FONT_FALLBACK = "'Segoe UI Emoji','Segoe UI Symbol','Apple Color Emoji'"
 WEEKDAY_KR = ["월","화","수","목","금","토","일"]
+PAGE_SIZE = 200  # 리스트 한 번에 불러오는 행 수 (스크롤 시 다음 페이지)
+ENTRY_COLS = "date_iso, date_label, daily_log, trades, holdings, considerations, interests"
+HEADERS = ["날짜", "Daily Log", "주식 거래내역", "남은 주식 수(증권사별)", "주식 고려사항", "관심 주"]
+# updated_at 기록용 (밀리초까지 - 같은 초 안의 연속 저장도 ETag/변경 감지에서 구분)
+NOW_SQL = "strftime('%Y-%m-%d %H:%M:%f','now','localtime')"
+EXTERNAL_POLL_MS = 2000  # 외부 변경 확인 주기 (PRAGMA data_version)
+INDEX_VERSION = 6  # 파생 인덱스 형식이 바뀌면 올림 → 열 때 전체 재색인
+# Daily Log 칩 (이모지, 활동명) - 칩 툴바와 활동 통계 추출이 같이 사용
+ACTIVITY_CHIPS = [("🍲", "점심"), ("🚶", "점심운동"), ("👟", "운동"), ("🌳", "산책"), ("📖", "독서")]
+ACTIVITIES = [name for _, name in ACTIVITY_CHIPS]
+RANGE_ALL, RANGE_30D, RANGE_YEAR, RANGE_CUSTOM = range(4)
 
 # ===== Helpers =====
 def normalize_date(input_str: str):
@@ -41,6 +62,191 @@ def normalize_date(input_str: str):
     iso = dt.strftime("%Y-%m-%d")
     return iso, f"{iso} ({WEEKDAY_KR[dt.weekday()]})"
 
+# ===== Activity tags (Daily Log 칩 → 통계) =====
+# "🚶 점심운동: ..." 처럼 줄/쉼표 경계에서 시작하는 '활동명:' 항목. 긴 이름을 먼저 두어 '점심운동'이 '점심'/'운동'으로 잡히지 않게 함
+_ACTIVITY_RE = re.compile(
+    r"(?:^|(?<=[\s,/|]))(?:[" + "".join(e for e, _ in ACTIVITY_CHIPS) + r"]\ufe0f?\s*)?("
+    + "|".join(sorted(map(re.escape, ACTIVITIES), key=len, reverse=True)) + r")\s*:", re.M)
+
+def extract_activities(daily_log: str):
+    """Daily Log 텍스트 → {활동명: 횟수} (내용이 빈 칩은 제외)"""
+    text = daily_log or ""
+    tags = list(_ACTIVITY_RE.finditer(text))
+    counts = {}
+    for i, m in enumerate(tags):
+        # 내용 = 다음 태그 전까지, 줄바꿈/쉼표에서 끊음
+        end = tags[i + 1].start() if i + 1 < len(tags) else len(text)
+        if re.split(r"[\n,]", text[m.end():end], maxsplit=1)[0].strip():
+            counts[m.group(1)] = counts.get(m.group(1), 0) + 1
+    return counts
+
+# ===== Interest tokens (관심 주 → 워치리스트) =====
+INTEREST_MARKERS = ("✅", "⭐")
+_INTEREST_STOPWORDS = {"관심주", "관심", "강조", "체크", "관심종목"}
+_INTEREST_ITEM_RE = re.compile(r"[,/|·;]+")          # 종목 항목 구분
+_INTEREST_WORD_RE = re.compile(r"[\s()\[\]{}:]+")   # 항목 안의 단어 구분
+_TICKER_RE = re.compile(r"[A-Z][A-Z0-9]*(?:[.\-][A-Z0-9]+)?")
+
+def _is_symbol(word: str) -> bool:
+    # 이름 뒤에 이어져도 종목으로 보는 단어: 대문자 티커(NVDA, BRK.B) 또는 6자리 종목코드
+    return bool(_TICKER_RE.fullmatch(word)) or (len(word) == 6 and word.isdigit())
+
+def extract_interest_tokens(interests: str):
+    """
+    관심 주 텍스트 → {(종목, 마커)} - 마커는 다음 마커 전까지 뒤따르는 종목에 적용 (마커 없으면 "").
+    항목(쉼표 등으로 구분)마다 첫 종목 이름과, 바로 뒤에 이어지는 티커/종목코드만 잡고
+    그 밖의 단어("NVDA 목표가 상향"의 목표가/상향)는 메모로 보고 버림.
+    """
+    out = set()
+    for line in (interests or "").splitlines():
+        marker = ""  # 마커는 줄 단위로 초기화
+        for part in re.split("(" + "|".join(INTEREST_MARKERS) + ")", line):
+            if part in INTEREST_MARKERS:
+                marker = part; continue
+            for item in _INTEREST_ITEM_RE.split(part.replace("\ufe0f", "")):
+                named = False
+                for word in _INTEREST_WORD_RE.split(item):
+                    word = word.strip("-•*.'\"")
+                    if not word: continue
+                    if named:
+                        if not _is_symbol(word): break  # 이름 뒤 첫 일반 단어에서 항목 끝
+                        out.add((word, marker)); continue
+                    tok = word.upper() if word.isascii() else word
+                    if len(tok) < 2 or tok in _INTEREST_STOPWORDS: continue
+                    if tok[0].isdigit() and not (len(tok) == 6 and tok.isdigit()): continue  # 수량/가격(10주, 75.5) 제외, 6자리 종목코드만
+                    out.add((tok, marker)); named = True
+    return out
+
+# ===== Korean search keys (초성 / 자모 분해) =====
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = ["ㅏ","ㅐ","ㅑ","ㅒ","ㅓ","ㅔ","ㅕ","ㅖ","ㅗ","ㅗㅏ","ㅗㅐ","ㅗㅣ","ㅛ","ㅜ","ㅜㅓ","ㅜㅔ","ㅜㅣ","ㅠ","ㅡ","ㅡㅣ","ㅣ"]
+_JONG = ["","ㄱ","ㄲ","ㄱㅅ","ㄴ","ㄴㅈ","ㄴㅎ","ㄷ","ㄹ","ㄹㄱ","ㄹㅁ","ㄹㅂ","ㄹㅅ","ㄹㅌ","ㄹㅍ","ㄹㅎ",
+         "ㅁ","ㅂ","ㅂㅅ","ㅅ","ㅆ","ㅇ","ㅈ","ㅊ","ㅋ","ㅌ","ㅍ","ㅎ"]
+# 입력 중 단독으로 들어오는 겹자모도 IME 타건 순서대로 분해 (ㄺ → ㄹㄱ, ㅘ → ㅗㅏ)
+_COMPAT_SPLIT = {"ㄳ":"ㄱㅅ","ㄵ":"ㄴㅈ","ㄶ":"ㄴㅎ","ㄺ":"ㄹㄱ","ㄻ":"ㄹㅁ","ㄼ":"ㄹㅂ","ㄽ":"ㄹㅅ","ㄾ":"ㄹㅌ",
+                 "ㄿ":"ㄹㅍ","ㅀ":"ㄹㅎ","ㅄ":"ㅂㅅ","ㅘ":"ㅗㅏ","ㅙ":"ㅗㅐ","ㅚ":"ㅗㅣ","ㅝ":"ㅜㅓ","ㅞ":"ㅜㅔ",
+                 "ㅟ":"ㅜㅣ","ㅢ":"ㅡㅣ"}
+
+# 완성 음절마다 앞에 붙이는 경계 표시 - 검색어의 받침이 다음 음절의 초성과 이어 붙어 매칭되지 않게 함
+# ("일" = ␞ㅇㅣㄹ 은 "이렇게" = ␞ㅇㅣ␞ㄹㅓㅎ… 에 안 걸림). 마지막 음절 뒤는 열어 두어 "키우"는 "키움"에 매칭
+SYLLABLE_MARK = "\x1e"
+
+def _jamo_of(ch: str) -> str:
+    code = ord(ch) - 0xAC00
+    if 0 <= code < 11172:
+        return SYLLABLE_MARK + _CHO[code // 588] + _JUNG[(code % 588) // 28] + _JONG[code % 28]
+    return _COMPAT_SPLIT.get(ch, ch)
+
+def _choseong_of(ch: str) -> str:
+    code = ord(ch) - 0xAC00
+    return _CHO[code // 588] if 0 <= code < 11172 else ch
+
+def _keyed(text: str, conv):
+    # 글자 단위로 변환하면서 변환 결과 각 위치 → 원문 글자 인덱스 맵을 함께 만듦 (하이라이트용)
+    out, pos = [], []
+    for i, ch in enumerate(text):
+        piece = conv(ch.casefold()) if len(ch.casefold()) == 1 else "".join(conv(c) for c in ch.casefold())
+        out.append(piece); pos.extend([i] * len(piece))
+    return "".join(out), pos
+
+def jamo_key(text: str) -> str:
+    return _keyed(text or "", _jamo_of)[0]
+
+def choseong_key(text: str) -> str:
+    return _keyed(text or "", _choseong_of)[0]
+
+def is_choseong_query(key: str) -> bool:
+    # 자음(호환 자모)만 있고 모음/완성 음절이 없는 검색어 ("ㅋㅇ") → 초성형에서만 찾음
+    # (자모 분해형에서 찾으면 "녘에" = ㄴㅕ[ㅋ][ㅇ]ㅔ 처럼 음절 경계를 넘어 잘못 매칭됨)
+    return any("\u3131" <= c <= "\u314e" for c in key) and not any("\u314f" <= c <= "\u3163" for c in key)
+
+def search_haystack(label, *fields):
+    """검색 인덱스 문서 → (자모 분해형, 초성형). 필드 경계는 줄바꿈으로 구분 (필드를 넘나드는 매칭 방지)"""
+    fields = [f or "" for f in fields]
+    return ("\n".join([jamo_key(label)] + [jamo_key(f) for f in fields]),
+            "\n".join(choseong_key(f) for f in fields))
+
+def match_spans(text: str, query: str):
+    """원문 text에서 query(자모/초성)가 매칭되는 글자 구간 [(start, end), ...] - 조합 중인 음절은 음절 전체"""
+    key = jamo_key((query or "").strip())
+    if not text or not key: return []
+    spans = []
+    for conv in ((_choseong_of,) if is_choseong_query(key) else (_jamo_of,)):
+        hay, pos = _keyed(text, conv)
+        i = hay.find(key)
+        while i >= 0:
+            spans.append((pos[i], pos[i + len(key) - 1] + 1))
+            i = hay.find(key, i + 1)
+    spans.sort()
+    merged = []
+    for a, b in spans:
+        if merged and a <= merged[-1][1]: merged[-1] = (merged[-1][0], max(merged[-1][1], b))
+        else: merged.append((a, b))
+    return merged
+
+# ===== Compact rows / archived text compression =====
+ARCHIVE_AFTER_MONTHS = 12  # 이보다 오래된 항목의 긴 텍스트를 zlib으로 압축 (파일 → 오래된 항목 압축)
+COMPRESS_MIN_BYTES = 96    # 이보다 짧은 텍스트는 압축 이득이 없어 그대로 둠
+TEXT_COLS = ["daily_log", "trades", "holdings", "considerations", "interests"]
+
+def pack_text(v):
+    """긴 텍스트 → zlib BLOB (줄어들 때만). sqlite에서 BLOB으로 저장되어 TEXT와 구분됨"""
+    if not isinstance(v, str): return v
+    raw = v.encode("utf-8")
+    if len(raw) < COMPRESS_MIN_BYTES: return v
+    z = zlib.compress(raw, 9)
+    return z if len(z) < len(raw) else v
+
+def unpack_text(v):
+    return zlib.decompress(v).decode("utf-8") if isinstance(v, (bytes, memoryview)) else v
+
+def date_label_of(date_iso: str) -> str:
+    d = date.fromisoformat(date_iso)
+    return f"{date_iso} ({WEEKDAY_KR[d.weekday()]})"
+
+class EntryRow:
+    """
+    entries 한 행의 __slots__ 레코드 (튜플처럼 r[0]..r[6] 인덱싱 가능).
+    날짜 라벨은 date_iso에서 파생해 따로 저장하지 않고, 압축된 텍스트는 처음 접근할 때 풀어 그 값을 보관합니다.
+    """
+    __slots__ = ("date_iso", "_label", "_daily_log", "_trades", "_holdings", "_considerations", "_interests")
+    FIELDS = ("date_iso", "date_label", "daily_log", "trades", "holdings", "considerations", "interests")
+
+    def __init__(self, date_iso, date_label, daily_log, trades, holdings, considerations, interests):
+        self.date_iso = date_iso
+        # normalize_date 형식("YYYY-MM-DD (요)")이면 저장 생략
+        self._label = None if (date_label and len(date_label) == 14 and date_label.startswith(date_iso)) else date_label
+        self._daily_log, self._trades, self._holdings = daily_log, trades, holdings
+        self._considerations, self._interests = considerations, interests
+
+    @classmethod
+    def from_cursor(cls, cursor, row):
+        return cls(*row)
+
+    @property
+    def date_label(self): return self._label or date_label_of(self.date_iso)
+
+    def _text(slot):
+        # 압축 BLOB은 처음 읽을 때 한 번만 풀고 슬롯에 문자열로 바꿔 둠 (리스트 repaint마다 zlib 반복 방지)
+        def get(self):
+            v = getattr(self, slot)
+            if isinstance(v, (bytes, memoryview)):
+                v = unpack_text(v); setattr(self, slot, v)
+            return v
+        return property(get)
+    daily_log, trades, holdings = _text("_daily_log"), _text("_trades"), _text("_holdings")
+    considerations, interests = _text("_considerations"), _text("_interests")
+    del _text
+
+    def __getitem__(self, i):
+        if isinstance(i, slice): return tuple(self)[i]
+        return getattr(self, self.FIELDS[i])
+
+    def __len__(self): return len(self.FIELDS)
+    def __iter__(self): return (getattr(self, f) for f in self.FIELDS)
+    def __eq__(self, other): return tuple(self) == tuple(other)
+    def __repr__(self): return f"EntryRow({self.date_iso!r})"
+
 class DailyLogDB:
     def __init__(self, db_path="daily_log.db"):
         self.db_path = db_path
@@ -58,45 +264,198 @@ class DailyLogDB:
                 updated_at TEXT
             );
             """
-        ); self.conn.commit()
+        )
+        # 파생 인덱스 상태 (행별 updated_at/버전 → 어긋난 행만 다시 색인)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS index_state(
+                date_iso TEXT PRIMARY KEY,
+                updated_at TEXT,
+                version INTEGER,
+                doc_id INTEGER
+            );
+            """
+        )
+        # 검색 인덱스: 자모 분해 텍스트(haystack) + 초성(choseong). FTS5 trigram이면 '%..%' LIKE도 인덱스로 처리됨
+        cols = [r[1] for r in self.conn.execute("PRAGMA table_info(entries_search)")]
+        if cols and "choseong" not in cols:
+            # 이전 형식(자모+초성 한 칸) → 다시 만들고 INDEX_VERSION 차이로 전체 재색인
+            self.conn.execute("DROP TABLE entries_search")
+            self.conn.execute("UPDATE index_state SET doc_id=NULL")
+        try:
+            self.conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS entries_search USING fts5(date_iso UNINDEXED, haystack, choseong, tokenize='trigram')")
+        except sqlite3.OperationalError:
+            # FTS5/trigram 미지원 sqlite: 같은 스키마의 일반 테이블 (LIKE 선형 검색)
+            self.conn.execute("CREATE TABLE IF NOT EXISTS entries_search(date_iso TEXT, haystack TEXT, choseong TEXT)")
+        # 활동 통계: 날짜별 Daily Log 칩 횟수 (대시보드는 원문을 다시 읽지 않음)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS activity_log(
+                date_iso TEXT,
+                activity TEXT,
+                count INTEGER,
+                PRIMARY KEY(date_iso, activity)
+            ) WITHOUT ROWID;
+            """
+        )
+        # 관심주 역색인: 종목 → (날짜, 마커) 포스팅
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS interest_postings(
+                token TEXT,
+                date_iso TEXT,
+                marker TEXT,
+                PRIMARY KEY(token, date_iso, marker)
+            ) WITHOUT ROWID;
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS interest_postings_date ON interest_postings(date_iso)")
+        self.conn.commit()
+        self._sync_indexes()
 
     def close(self): self.conn.close()
 
-    def get_all(self, search_text: str = ""):
+    # ===== 파생 인덱스 =====
+    def _reindex(self, date_iso):
+        # 저장 직후 같은 트랜잭션 안에서 호출 (commit은 호출한 쪽에서)
         cur = self.conn.cursor()
+        cur.execute("SELECT date_label, daily_log, trades, holdings, considerations, interests, updated_at FROM entries WHERE date_iso=?", (date_iso,))
+        row = cur.fetchone()
+        if row is None:
+            self._unindex(date_iso); return
+        row = [unpack_text(v) for v in row]
+        st = cur.execute("SELECT doc_id FROM index_state WHERE date_iso=?", (date_iso,)).fetchone()
+        if st and st[0] is not None:
+            cur.execute("DELETE FROM entries_search WHERE rowid=?", (st[0],))
+        cur.execute("INSERT INTO entries_search(date_iso, haystack, choseong) VALUES(?,?,?)", (date_iso, *search_haystack(*row[:6])))
+        doc_id = cur.lastrowid
+        cur.execute("DELETE FROM activity_log WHERE date_iso=?", (date_iso,))
+        cur.executemany("INSERT INTO activity_log(date_iso, activity, count) VALUES(?,?,?)",
+                        [(date_iso, a, n) for a, n in extract_activities(row[1]).items()])
+        cur.execute("DELETE FROM interest_postings WHERE date_iso=?", (date_iso,))
+        cur.executemany("INSERT INTO interest_postings(token, date_iso, marker) VALUES(?,?,?)",
+                        [(tok, date_iso, mk) for tok, mk in extract_interest_tokens(row[5])])
+        cur.execute("INSERT OR REPLACE INTO index_state(date_iso, updated_at, version, doc_id) VALUES(?,?,?,?)",
+                    (date_iso, row[6], INDEX_VERSION, doc_id))
+
+    def _unindex(self, date_iso):
+        cur = self.conn.cursor()
+        st = cur.execute("SELECT doc_id FROM index_state WHERE date_iso=?", (date_iso,)).fetchone()
+        if st and st[0] is not None:
+            cur.execute("DELETE FROM entries_search WHERE rowid=?", (st[0],))
+        cur.execute("DELETE FROM activity_log WHERE date_iso=?", (date_iso,))
+        cur.execute("DELETE FROM interest_postings WHERE date_iso=?", (date_iso,))
+        cur.execute("DELETE FROM index_state WHERE date_iso=?", (date_iso,))
+
+    def _sync_indexes(self):
+        """다른 프로그램/이전 버전이 쓴 행 등 인덱스와 어긋난 행만 다시 색인"""
+        cur = self.conn.cursor()
+        stale = [r[0] for r in cur.execute(
+            """
+            SELECT e.date_iso FROM entries e LEFT JOIN index_state s ON s.date_iso = e.date_iso
+            WHERE s.date_iso IS NULL OR s.updated_at IS NOT e.updated_at OR s.version < ?
+            """, (INDEX_VERSION,)).fetchall()]
+        orphans = [r[0] for r in cur.execute(
+            "SELECT date_iso FROM index_state WHERE date_iso NOT IN (SELECT date_iso FROM entries)").fetchall()]
+        if not stale and not orphans: return []
+        for iso in orphans: self._unindex(iso)
+        for iso in stale: self._reindex(iso)
+        self.conn.commit()
+        return stale
+
+    @staticmethod
+    def _where(search_text="", date_from=None, date_to=None, before=None, token=None):
+        # date_iso 조건을 먼저 두어 PK 인덱스 범위 스캔 → 검색은 해당 구간만 훑음
+        conds, params = [], []
+        if date_from: conds.append("date_iso >= ?"); params.append(date_from)
+        if date_to: conds.append("date_iso <= ?"); params.append(date_to)
+        if before: conds.append("date_iso < ?"); params.append(before)
+        if token: conds.append("date_iso IN (SELECT date_iso FROM interest_postings WHERE token = ?)"); params.append(token)
         if search_text:
-            like = f"%{search_text.lower()}%"
-            cur.execute(
-                """
-                SELECT date_iso, date_label, daily_log, trades, holdings, considerations, interests
-                FROM entries
-                WHERE lower(date_label) LIKE ?
-                   OR lower(daily_log) LIKE ?
-                   OR lower(trades) LIKE ?
-                   OR lower(holdings) LIKE ?
-                   OR lower(considerations) LIKE ?
-                   OR lower(interests) LIKE ?
-                ORDER BY date_iso DESC;
-                """,(like,like,like,like,like,like))
-        else:
-            cur.execute(
-                """
-                SELECT date_iso, date_label, daily_log, trades, holdings, considerations, interests
-                FROM entries ORDER BY date_iso DESC;
-                """
-            )
+            # 자모/초성 검색 인덱스 경유 ("ㅋㅇ" → 키움, "키우" → 키움)
+            key = jamo_key(search_text)
+            col = "choseong" if is_choseong_query(key) else "haystack"
+            if len(key) >= 3:
+                conds.append(f"date_iso IN (SELECT date_iso FROM entries_search WHERE {col} LIKE ?)")
+                params.append(f"%{key}%")
+            else:
+                # trigram은 3글자 미만 패턴을 색인으로 못 찾음 (비ASCII는 아예 0건) → 날짜 구간에 든 행의 문서만 doc_id로 직접 확인
+                conds.append("EXISTS (SELECT 1 FROM entries_search WHERE rowid=(SELECT doc_id FROM index_state "
+                             f"WHERE date_iso=entries.date_iso) AND instr({col}, ?) > 0)")
+                params.append(key)
+        return (" WHERE " + " AND ".join(conds)) if conds else "", params
+
+    def get_all(self, search_text: str = "", date_from=None, date_to=None):
+        where, params = self._where(search_text, date_from, date_to)
+        cur = self.conn.cursor(); cur.row_factory = EntryRow.from_cursor
+        cur.execute(f"SELECT {ENTRY_COLS} FROM entries{where} ORDER BY date_iso DESC;", params)
+        return cur.fetchall()
+
+    def get_page(self, before=None, limit=PAGE_SIZE, search_text: str = "", date_from=None, date_to=None, token=None):
+        """keyset 페이지: before보다 이전 날짜를 date_iso DESC로 최대 limit개 (OFFSET 없이 PK 인덱스 사용)"""
+        where, params = self._where(search_text, date_from, date_to, before, token)
+        cur = self.conn.cursor(); cur.row_factory = EntryRow.from_cursor
+        cur.execute(f"SELECT {ENTRY_COLS} FROM entries{where} ORDER BY date_iso DESC LIMIT ?;", params + [limit])
         return cur.fetchall()
 
     def get_by_date(self, date_iso: str):
         cur = self.conn.cursor()
         cur.execute("SELECT date_label, daily_log, trades, holdings, considerations, interests FROM entries WHERE date_iso=?", (date_iso,))
-        return cur.fetchone()
+        row = cur.fetchone()
+        return tuple(unpack_text(v) for v in row) if row else None
 
     def get_all_dates(self):
         cur = self.conn.cursor()
         cur.execute("SELECT date_iso FROM entries")
         return [r[0] for r in cur.fetchall()]
 
+    def get_rows(self, dates, search_text: str = "", date_from=None, date_to=None, token=None):
+        """지정한 날짜들 중 현재 필터에 맞는 행만 (외부 변경 반영용)"""
+        dates = list(dates); out = []
+        where, params = self._where(search_text, date_from, date_to, None, token)
+        cur = self.conn.cursor(); cur.row_factory = EntryRow.from_cursor
+        for i in range(0, len(dates), 500):
+            chunk = dates[i:i+500]
+            cond = f"date_iso IN ({','.join('?' * len(chunk))})"
+            cur.execute(f"SELECT {ENTRY_COLS} FROM entries{where + ' AND ' if where else ' WHERE '}{cond} ORDER BY date_iso DESC", params + chunk)
+            out.extend(cur.fetchall())
+        return out
+
+    def get_updated_at(self, date_iso: str):
+        row = self.conn.execute("SELECT updated_at FROM entries WHERE date_iso=?", (date_iso,)).fetchone()
+        return row[0] if row else None
+
+    def max_updated_at(self):
+        return self.conn.execute("SELECT max(updated_at) FROM entries").fetchone()[0] or ""
+
+    def get_changed_since(self, watermark: str):
+        """updated_at이 watermark보다 새 행들의 (date_iso, updated_at)"""
+        cur = self.conn.cursor()
+        cur.execute("SELECT date_iso, updated_at FROM entries WHERE updated_at > ? ORDER BY updated_at", (watermark or "",))
+        return cur.fetchall()
+
+    def data_version(self):
+        # 다른 연결(다른 프로세스/기기)이 커밋할 때만 바뀜 - 자기 커밋은 반영 안 됨
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get_watchlist(self):
+        """관심주 역색인 집계: (종목, 처음, 마지막, 등장 일수, ⭐ 일수) - 최근 등장 순"""
+        cur = self.conn.cursor()
+        cur.execute(
+            """
+            SELECT token, min(date_iso), max(date_iso), count(DISTINCT date_iso), sum(marker = '⭐')
+            FROM interest_postings GROUP BY token ORDER BY max(date_iso) DESC, token
+            """
+        )
+        return cur.fetchall()
+
+    def get_activity_counts(self, date_from=None, date_to=None):
+        """활동 통계 테이블 (date_iso, activity, count) - 원문 재파싱 없음"""
+        cur = self.conn.cursor()
+        cur.execute("SELECT date_iso, activity, count FROM activity_log WHERE date_iso >= ? AND date_iso <= ? ORDER BY date_iso",
+                    (date_from or "0000-00-00", date_to or "9999-99-99"))
+        return cur.fetchall()
+
     def upsert_merge(self, date_iso, date_label, vals):
         cur = self.conn.cursor()
         cur.execute("SELECT daily_log,trades,holdings,considerations,interests FROM entries WHERE date_iso=?", (date_iso,))
@@ -105,22 +464,23 @@ class DailyLogDB:
         if row:
             merged={}
             for i,c in enumerate(cols):
-                old=row[i] or ""; new=vals.get(c,"") or ""
+                old=unpack_text(row[i]) or ""; new=vals.get(c,"") or ""
                 merged[c] = (old.strip()+"\n"+new.strip()) if (old and new) else (old or new).strip()
             cur.execute(
-                """
+                f"""
                 UPDATE entries
-                SET date_label=?, daily_log=?, trades=?, holdings=?, considerations=?, interests=?, updated_at=datetime('now','localtime')
+                SET date_label=?, daily_log=?, trades=?, holdings=?, considerations=?, interests=?, updated_at={NOW_SQL}
                 WHERE date_iso=?""",
                 (date_label, merged["daily_log"], merged["trades"], merged["holdings"],
                  merged["considerations"], merged["interests"], date_iso))
         else:
             cur.execute(
-                """
+                f"""
                 INSERT INTO entries(date_iso,date_label,daily_log,trades,holdings,considerations,interests,updated_at)
-                VALUES(?,?,?,?,?,?,?,datetime('now','localtime'))""",
+                VALUES(?,?,?,?,?,?,?,{NOW_SQL})""",
                 (date_iso,date_label,vals.get("daily_log",""),vals.get("trades",""),
                  vals.get("holdings",""),vals.get("considerations",""),vals.get("interests","")))
+        self._reindex(date_iso)
         self.conn.commit()
 
     def overwrite(self, date_iso, date_label, vals):
@@ -128,57 +488,537 @@ class DailyLogDB:
         cur.execute("SELECT 1 FROM entries WHERE date_iso=?", (date_iso,))
         if cur.fetchone():
             cur.execute(
-                """
+                f"""
                 UPDATE entries
-                SET date_label=?, daily_log=?, trades=?, holdings=?, considerations=?, interests=?, updated_at=datetime('now','localtime')
+                SET date_label=?, daily_log=?, trades=?, holdings=?, considerations=?, interests=?, updated_at={NOW_SQL}
                 WHERE date_iso=?""",
                 (date_label, vals.get("daily_log",""), vals.get("trades",""), vals.get("holdings",""),
                  vals.get("considerations",""), vals.get("interests",""), date_iso))
         else:
             cur.execute(
-                """
+                f"""
                 INSERT INTO entries(date_iso,date_label,daily_log,trades,holdings,considerations,interests,updated_at)
-                VALUES(?,?,?,?,?,?,?,datetime('now','localtime'))""",
+                VALUES(?,?,?,?,?,?,?,{NOW_SQL})""",
                 (date_iso,date_label,vals.get("daily_log",""),vals.get("trades",""),
                  vals.get("holdings",""),vals.get("considerations",""),vals.get("interests","")))
+        self._reindex(date_iso)
         self.conn.commit()
 
     def delete(self, date_iso):
         self.conn.execute("DELETE FROM entries WHERE date_iso=?", (date_iso,))
+        self._unindex(date_iso)
         self.conn.commit()
 
     def wipe_all(self):
         self.conn.execute("DELETE FROM entries;")
+        self.conn.execute("DELETE FROM entries_search;")
+        self.conn.execute("DELETE FROM activity_log;")
+        self.conn.execute("DELETE FROM interest_postings;")
+        self.conn.execute("DELETE FROM index_state;")
         self.conn.commit()
 
+    def compress_archived(self, months=ARCHIVE_AFTER_MONTHS, vacuum=True):
+        """months개월보다 오래된 항목의 긴 텍스트를 zlib BLOB으로 압축 (updated_at 유지 → 캐시/동기화 영향 없음)"""
+        t = date.today(); y, m = divmod(t.year * 12 + t.month - 1 - months, 12)
+        cutoff = f"{y:04d}-{m + 1:02d}-01"
+        changed = 0
+        for rows in self._text_batches("date_iso < ?", (cutoff,)):
+            for r in rows:
+                packed = [pack_text(v) for v in r[1:]]
+                if any(p is not v for p, v in zip(packed, r[1:])):
+                    self.conn.execute(f"UPDATE entries SET {', '.join(c + '=?' for c in TEXT_COLS)} WHERE date_iso=?", (*packed, r[0]))
+                    changed += 1
+            self.conn.commit()  # 배치마다 커밋 → 쓰기 잠금을 짧게 (GUI 저장이 사이사이 들어올 수 있음)
+        if changed and vacuum: self.conn.execute("VACUUM")
+        return changed
+
+    def decompress_all(self, vacuum=False):
+        """압축된 텍스트를 모두 일반 TEXT로 되돌림 (이전 버전/외부 도구와 DB를 공유할 때)"""
+        changed = 0
+        blob = " OR ".join(f"typeof({c})='blob'" for c in TEXT_COLS)
+        for rows in self._text_batches(f"({blob})", ()):
+            for r in rows:
+                self.conn.execute(f"UPDATE entries SET {', '.join(c + '=?' for c in TEXT_COLS)} WHERE date_iso=?",
+                                  (*[unpack_text(v) for v in r[1:]], r[0]))
+                changed += 1
+            self.conn.commit()
+        if changed and vacuum: self.conn.execute("VACUUM")
+        return changed
+
+    def _text_batches(self, cond, params, size=500):
+        # date_iso keyset으로 (date_iso, 텍스트 열들)을 size개씩 - 전체를 한 번에 메모리에 올리지 않음
+        after = ""
+        while True:
+            rows = self.conn.execute(f"SELECT date_iso, {', '.join(TEXT_COLS)} FROM entries WHERE {cond} AND date_iso > ? "
+                                     "ORDER BY date_iso LIMIT ?", (*params, after, size)).fetchall()
+            if not rows: return
+            yield rows
+            after = rows[-1][0]
+
+# ===== Local API Server (스크립트/외부 도구용, 127.0.0.1 전용) =====
+API_COLS = ENTRY_COLS + ", updated_at"
+API_FIELDS = ["date_iso", "date_label", "daily_log", "trades", "holdings", "considerations", "interests", "updated_at"]
+API_STREAM_CHUNK = 500
+API_POOL_TIMEOUT = 5  # 풀 연결을 이 시간(초) 안에 못 빌리면 503
+API_LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+def _api_row(row):
+    return {k: unpack_text(v) for k, v in zip(API_FIELDS, row)}
+
+def _api_date(s):
+    # API 입력은 엄격하게 검사 (normalize_date처럼 오늘로 대체하지 않음)
+    if not s: return None
+    try: return datetime.strptime(s, "%Y-%m-%d").date().isoformat()
+    except ValueError: raise ValueError(f"날짜 형식 오류: {s} (YYYY-MM-DD)")
+
+class PoolBusy(RuntimeError):
+    """읽기 연결 풀이 비어 제한 시간 안에 연결을 빌리지 못함 (→ 503)"""
+
+class ReadConnectionPool:
+    """읽기 전용 sqlite 연결 풀 - 쿼리 한 번 동안만 빌려 쓰고 반납 (GUI 연결과 경합하지 않음)"""
+    def __init__(self, db_path, size=4):
+        self._uri = "file:" + pathname2url(os.path.abspath(db_path)) + "?mode=ro"
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(sqlite3.connect(self._uri, uri=True, timeout=5, check_same_thread=False))
+
+    @contextmanager
+    def connection(self, timeout=API_POOL_TIMEOUT):
+        try: conn = self._idle.get(timeout=timeout)
+        except queue.Empty: raise PoolBusy("읽기 연결이 모두 사용 중입니다")
+        try: yield conn
+        finally: self._idle.put(conn)
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+class DailyLogServer:
+    """
+    DailyLogDB 위의 로컬 JSON/HTTP API (asyncio).
+      GET  /entries/<date>                 단일 날짜 (ETag = updated_at)
+      GET  /entries?from=&to=&before=&limit=  기간 조회 (date_iso DESC, 스트리밍 JSON)
+      GET  /search?q=&from=&to=&limit=        검색 (스트리밍 JSON)
+      POST /entries/<date>[?mode=overwrite]   추가/병합 저장 (기본) 또는 덮어쓰기
+    GET 응답에는 ETag가 붙고, If-None-Match가 일치하면 본문 없이 304를 돌려줍니다.
+    """
+    def __init__(self, db_path, host="127.0.0.1", port=8765, pool_size=4):
+        if host not in API_LOCAL_HOSTS:
+            raise ValueError(f"로컬 전용 서버입니다: {host}")
+        self.db_path, self.host, self.port, self.pool_size = db_path, host, port, pool_size
+        self.pool = None
+        self._server = None
+        self._writer_db = None
+        # sqlite 연결은 스레드에 묶이므로 쓰기는 전용 스레드 하나에서만 수행
+        self._write_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dailylog-write")
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._write_exec, self._open_writer)  # 테이블 생성 보장
+        self.pool = ReadConnectionPool(self.db_path, self.pool_size)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]  # port=0이면 실제 할당 포트
+        return self.port
+
+    async def serve_forever(self):
+        if self._server is None: await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close(); await self._server.wait_closed(); self._server = None
+        if self.pool is not None:
+            self.pool.close(); self.pool = None
+        if self._writer_db is not None:
+            await asyncio.get_running_loop().run_in_executor(self._write_exec, self._writer_db.close)
+            self._writer_db = None
+        self._write_exec.shutdown(wait=False)
+
+    def _open_writer(self):
+        self._writer_db = DailyLogDB(self.db_path)
+
+    # --- HTTP ---
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip(): break
+                try:
+                    method, target, version = line.decode("latin-1").split()
+                except ValueError:
+                    await self._send_json(writer, 400, {"error": "bad request line"}, close=True); break
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""): break
+                    k, _, v = h.decode("latin-1").partition(":")
+                    headers[k.strip().lower()] = v.strip()
+                body = b""
+                if headers.get("content-length"):
+                    try: size = int(headers["content-length"])
+                    except ValueError: size = -1
+                    if size < 0:
+                        await self._send_json(writer, 400, {"error": "Content-Length 오류"}, close=True); break
+                    body = await reader.readexactly(size)
+                keep = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                await self._dispatch(writer, method.upper(), target, headers, body, keep)
+                if not keep: break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            try:
+                writer.close(); await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _dispatch(self, writer, method, target, headers, body, keep):
+        url = urlsplit(target)
+        parts = [p for p in url.path.split("/") if p]
+        qs = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            if parts == ["entries"] and method == "GET":
+                date_from, date_to = _api_date(qs.get("from")), _api_date(qs.get("to"))
+                await self._send_rows(writer, headers, keep, "", date_from, date_to,
+                                      _api_date(qs.get("before")), self._limit(qs))
+            elif parts == ["search"] and method == "GET":
+                q = (qs.get("q") or "").strip()
+                if not q: raise ValueError("q 파라미터가 필요합니다")
+                await self._send_rows(writer, headers, keep, q, _api_date(qs.get("from")), _api_date(qs.get("to")),
+                                      None, self._limit(qs))
+            elif len(parts) == 2 and parts[0] == "entries" and method == "GET":
+                await self._send_entry(writer, headers, keep, _api_date(parts[1]))
+            elif len(parts) == 2 and parts[0] == "entries" and method in ("POST", "PUT"):
+                await self._save_entry(writer, headers, keep, _api_date(parts[1]), body, qs.get("mode") == "overwrite")
+            else:
+                await self._send_json(writer, 404, {"error": "not found"}, keep=keep)
+        except ValueError as e:
+            await self._send_json(writer, 400, {"error": str(e)}, keep=keep)
+        except PoolBusy as e:
+            await self._send_json(writer, 503, {"error": str(e)}, keep=keep)
+        except sqlite3.Error as e:  # 예: GUI 쓰기 중 database is locked
+            await self._send_json(writer, 500, {"error": f"DB 오류: {e}"}, keep=keep)
+
+    @staticmethod
+    def _limit(qs):
+        if "limit" not in qs: return None
+        n = int(qs["limit"])
+        if n <= 0: raise ValueError("limit은 1 이상이어야 합니다")
+        return n
+
+    async def _send_head(self, writer, status, headers, keep):
+        reason = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+                  412: "Precondition Failed", 500: "Internal Server Error",
+                  503: "Service Unavailable"}.get(status, "OK")
+        lines = [f"HTTP/1.1 {status} {reason}"] + [f"{k}: {v}" for k, v in headers]
+        lines.append("Connection: " + ("keep-alive" if keep else "close"))
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+    async def _send_json(self, writer, status, obj, etag=None, keep=True, close=False):
+        data = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        hdrs = [("Content-Type", "application/json; charset=utf-8"), ("Content-Length", len(data))]
+        if etag: hdrs.append(("ETag", etag))
+        await self._send_head(writer, status, hdrs, keep and not close)
+        writer.write(data); await writer.drain()
+
+    async def _not_modified(self, writer, headers, etag, keep):
+        if etag and headers.get("if-none-match") == etag:
+            await self._send_head(writer, 304, [("ETag", etag), ("Content-Length", 0)], keep)
+            return True
+        return False
+
+    async def _read(self, fn, *args):
+        # 풀에서 연결을 빌려 기본 스레드풀에서 실행 (이벤트 루프를 막지 않음)
+        def job():
+            with self.pool.connection() as conn:
+                return fn(conn, *args)
+        return await asyncio.get_running_loop().run_in_executor(None, job)
+
+    @staticmethod
+    def _entry_etag(row):
+        return f'"{row[0]}@{row[7]}"' if row else None
+
+    async def _send_entry(self, writer, headers, keep, date_iso):
+        row = await self._read(lambda c, d: c.execute(f"SELECT {API_COLS} FROM entries WHERE date_iso=?", (d,)).fetchone(), date_iso)
+        if row is None:
+            await self._send_json(writer, 404, {"error": f"{date_iso} 항목 없음"}, keep=keep); return
+        etag = self._entry_etag(row)
+        if await self._not_modified(writer, headers, etag, keep): return
+        await self._send_json(writer, 200, _api_row(row), etag=etag, keep=keep)
+
+    async def _send_rows(self, writer, headers, keep, search_text, date_from, date_to, before, limit):
+        where, params = DailyLogDB._where(search_text, date_from, date_to, before)
+        # 범위 ETag: 구간 모든 행의 (date_iso, updated_at) 해시 - 본문 직렬화 없이 두 열만 읽음.
+        # max(updated_at)만 보면 시계가 늦은 기기가 최신이 아닌 행을 고쳤을 때 변경을 놓침
+        stamp = await self._read(lambda c: c.execute(
+            "SELECT count(*), group_concat(date_iso || '@' || ifnull(updated_at, ''), ',') "
+            f"FROM (SELECT date_iso, updated_at FROM entries{where} ORDER BY date_iso)", params).fetchone())
+        etag = f'"{stamp[0]}-{hashlib.sha1((stamp[1] or "").encode("utf-8")).hexdigest()[:20]}"'
+        if await self._not_modified(writer, headers, etag, keep): return
+        await self._send_head(writer, 200, [("Content-Type", "application/json; charset=utf-8"),
+                                            ("Transfer-Encoding", "chunked"), ("ETag", etag)], keep)
+        # 배치마다 date_iso keyset으로 새로 조회 → 연결은 조회 동안만 빌리고, 쓰기/drain 중에는 풀에 반납된 상태
+        first, remaining = True, limit
+        self._write_chunk(writer, b"[")
+        try:
+            while remaining is None or remaining > 0:
+                n = API_STREAM_CHUNK if remaining is None else min(API_STREAM_CHUNK, remaining)
+                where, params = DailyLogDB._where(search_text, date_from, date_to, before)
+                rows = await self._read(lambda c: c.execute(
+                    f"SELECT {API_COLS} FROM entries{where} ORDER BY date_iso DESC LIMIT ?", params + [n]).fetchall())
+                if not rows: break
+                parts = [json.dumps(_api_row(r), ensure_ascii=False) for r in rows]
+                self._write_chunk(writer, (("" if first else ",") + ",".join(parts)).encode("utf-8"))
+                first, before = False, rows[-1][0]
+                if remaining is not None: remaining -= len(rows)
+                await writer.drain()
+                if len(rows) < n: break
+        except (PoolBusy, sqlite3.Error):
+            # 헤더를 이미 보냈으므로 오류 응답 대신 종료 청크 없이 연결을 끊음 (클라이언트는 불완전 응답으로 인지)
+            writer.transport.abort()
+            raise ConnectionAbortedError("stream aborted")
+        self._write_chunk(writer, b"]")
+        writer.write(b"0\r\n\r\n"); await writer.drain()
+
+    @staticmethod
+    def _write_chunk(writer, data: bytes):
+        writer.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+    async def _save_entry(self, writer, headers, keep, date_iso, body, overwrite):
+        try:
+            payload = json.loads(body.decode("utf-8") or "{}")
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ValueError("JSON 본문이 올바르지 않습니다")
+        if not isinstance(payload, dict): raise ValueError("JSON 객체가 필요합니다")
+        vals = {k: str(payload.get(k) or "") for k in ("daily_log", "trades", "holdings", "considerations", "interests")}
+        if_match = headers.get("if-match")
+
+        def job():
+            db = self._writer_db
+            row = db.conn.execute(f"SELECT {API_COLS} FROM entries WHERE date_iso=?", (date_iso,)).fetchone()
+            if if_match and if_match != "*" and if_match != self._entry_etag(row):
+                return None
+            _, label = normalize_date(date_iso)
+            if overwrite: db.overwrite(date_iso, label, vals)
+            else: db.upsert_merge(date_iso, label, {k: v.strip() for k, v in vals.items()})
+            return db.conn.execute(f"SELECT {API_COLS} FROM entries WHERE date_iso=?", (date_iso,)).fetchone()
+
+        row = await asyncio.get_running_loop().run_in_executor(self._write_exec, job)
+        if row is None:
+            await self._send_json(writer, 412, {"error": "ETag 불일치 (다른 곳에서 수정됨)"}, keep=keep); return
+        await self._send_json(writer, 200, _api_row(row), etag=self._entry_etag(row), keep=keep)
+
+def run_server(db_path, host="127.0.0.1", port=8765):
+    server = DailyLogServer(db_path, host, port)
+    async def main():
+        port_ = await server.start()
+        print(f"DailyLog API: http://{host}:{port_}  (DB: {db_path})", flush=True)
+        try: await server.serve_forever()
+        finally: await server.close()
+    try: asyncio.run(main())
+    except KeyboardInterrupt: pass
+
+# ===== Reports (HTML/PDF) =====
+REPORT_CHUNK = 200
+REPORT_TEMPLATE_VERSION = 1  # 일별 조각 HTML 형식이 바뀌면 올림 → 캐시 무효화
+REPORT_FIELDS = list(zip(["daily_log", "trades", "holdings", "considerations", "interests"], HEADERS[1:]))
+REPORT_CSS = """
+body { font-family: 'Noto Sans KR', 'Malgun Gothic', sans-serif; font-size: 10pt; color: #111827; }
+h1 { font-size: 18pt; color: #1E3A8A; margin-bottom: 2px; }
+p.meta { color: #6B7280; margin-top: 0; }
+h2 { font-size: 12pt; color: #FFFFFF; background-color: #2563EB; padding: 3px 6px; margin: 14px 0 4px 0; }
+h3 { font-size: 10pt; color: #1E3A8A; margin: 6px 0 2px 0; }
+p.field { margin: 0 0 4px 12px; }
+"""
+
+def render_day_fragment(row):
+    """entries 한 행 → 보고서 일별 HTML 조각 (빈 칸은 생략)"""
+    import html
+    parts = [f"<h2>{html.escape(row[1] or row[0])}</h2>"]
+    for i, (_, title) in enumerate(REPORT_FIELDS):
+        text = (unpack_text(row[i + 2]) or "").strip()
+        if text:
+            parts.append(f"<h3>{html.escape(title)}</h3><p class='field'>{html.escape(text).replace(chr(10), '<br>')}</p>")
+    return "\n".join(parts)
+
+class ReportGenerator:
+    """
+    기간 보고서 생성기 - GUI 없이도 사용 가능 (스크립트/--report).
+    entries를 REPORT_CHUNK 단위로 날짜 오름차순 스트리밍하고, 일별 HTML 조각은
+    (updated_at, 템플릿 버전) 키로 캐시 DB에 보관해 수정된 날만 다시 만듭니다.
+    PDF도 청크 단위로 배치해 바로 페이지로 내보내므로 기간 전체를 한 문서로 들고 있지 않지만,
+    PDF 배치/인쇄 자체는 캐시되지 않아 매번 기간 전체를 다시 합니다.
+    """
+    def __init__(self, db_path, cache_path=None):
+        self.db_path = db_path
+        self.cache_path = cache_path or os.path.splitext(db_path)[0] + ".report_cache.db"
+
+    def _open(self):
+        # 호출한 스레드 전용 연결 (QThreadPool 작업 스레드에서 생성)
+        src = sqlite3.connect("file:" + pathname2url(os.path.abspath(self.db_path)) + "?mode=ro", uri=True, timeout=5)
+        cache = sqlite3.connect(self.cache_path, timeout=5)
+        cache.execute("CREATE TABLE IF NOT EXISTS fragments(date_iso TEXT PRIMARY KEY, updated_at TEXT, version INTEGER, html TEXT)")
+        return src, cache
+
+    @staticmethod
+    def _chunks(src, date_from, date_to):
+        after = ""
+        while True:
+            rows = src.execute(
+                f"SELECT {ENTRY_COLS}, updated_at FROM entries WHERE date_iso >= ? AND date_iso <= ? AND date_iso > ? ORDER BY date_iso LIMIT ?",
+                (date_from, date_to, after, REPORT_CHUNK)).fetchall()
+            if not rows: return
+            yield rows
+            after = rows[-1][0]
+
+    def generate(self, date_from, date_to, html_path=None, pdf_path=None, progress=None):
+        """date_from~date_to(포함) 보고서를 html_path/pdf_path로 저장. 반환: {days, rendered, cached}"""
+        import html
+        src, cache = self._open()
+        stats = {"days": 0, "rendered": 0, "cached": 0}
+        total = src.execute("SELECT count(*) FROM entries WHERE date_iso >= ? AND date_iso <= ?", (date_from, date_to)).fetchone()[0]
+        head = (f"<html><head><meta charset='utf-8'><style>{REPORT_CSS}</style></head><body>"
+                f"<h1>Daily Log 리뷰</h1><p class='meta'>{html.escape(date_from)} ~ {html.escape(date_to)} · 기록 {total}일 · "
+                f"생성 {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>")
+        out = open(html_path, "w", encoding="utf-8") if html_path else None
+        pdf = _PdfChunkWriter(pdf_path, f"Daily Log {date_from} ~ {date_to}") if pdf_path else None
+        try:
+            if out: out.write(head)
+            pending = head  # 첫 청크와 함께 PDF로 (표지 제목만 한 페이지에 따로 두지 않음)
+            for rows in self._chunks(src, date_from, date_to):
+                marks = ",".join("?" * len(rows))
+                hit = {r[0]: r[1:] for r in cache.execute(
+                    f"SELECT date_iso, updated_at, version, html FROM fragments WHERE date_iso IN ({marks})", [r[0] for r in rows])}
+                fresh, frags = [], []
+                for r in rows:
+                    c = hit.get(r[0])
+                    if c and c[0] == r[7] and c[1] == REPORT_TEMPLATE_VERSION:
+                        frags.append(c[2]); stats["cached"] += 1
+                    else:
+                        frag = render_day_fragment(r); frags.append(frag); stats["rendered"] += 1
+                        fresh.append((r[0], r[7], REPORT_TEMPLATE_VERSION, frag))
+                if fresh:
+                    cache.executemany("INSERT OR REPLACE INTO fragments(date_iso, updated_at, version, html) VALUES(?,?,?,?)", fresh)
+                    cache.commit()
+                chunk_html = "\n".join(frags)
+                if out: out.write(chunk_html)
+                if pdf: pdf.add(pending + chunk_html)
+                pending = ""
+                stats["days"] += len(rows)
+                if progress: progress(stats["days"], total)
+            if out: out.write("</body></html>")
+            if pdf and pending: pdf.add(pending)  # 기록이 없는 기간
+        finally:
+            if out: out.close()
+            if pdf: pdf.close()
+            src.close(); cache.close()
+        return stats
+
+class _PdfChunkWriter:
+    """HTML 청크를 하나씩 배치해 QPdfWriter 페이지로 바로 그림 (청크마다 새 페이지에서 시작)"""
+    def __init__(self, pdf_path, title):
+        self.writer = QPdfWriter(pdf_path)
+        self.writer.setPageSize(QPageSize(QPageSize.A4))
+        self.writer.setPageMargins(QMarginsF(15, 15, 15, 15), QPageLayout.Millimeter)
+        self.writer.setTitle(title)
+        self.rect = self.writer.pageLayout().paintRectPixels(self.writer.resolution())
+        self.painter = QPainter(self.writer)
+        self.pages = 0
+
+    def add(self, chunk_html):
+        doc = QTextDocument()
+        doc.documentLayout().setPaintDevice(self.writer)  # 글꼴 pt → PDF 해상도 기준으로 배치
+        doc.setPageSize(QSizeF(self.rect.width(), self.rect.height()))
+        doc.setHtml(f"<html><head><meta charset='utf-8'><style>{REPORT_CSS}</style></head><body>{chunk_html}</body></html>")
+        h = self.rect.height()
+        for i in range(doc.pageCount()):
+            if self.pages: self.writer.newPage()
+            self.painter.save()
+            self.painter.translate(0, -i * h)
+            doc.drawContents(self.painter, QRectF(0, i * h, self.rect.width(), h))
+            self.painter.restore()
+            self.pages += 1
+
+    def close(self):
+        self.painter.end()
+
+class ReportSignals(QObject):
+    progress = Signal(int, int)
+    finished = Signal(dict)
+    failed = Signal(str)
+
+class ReportTask(QRunnable):
+    """ReportGenerator를 QThreadPool에서 실행 (GUI 스레드를 막지 않음)"""
+    def __init__(self, generator, date_from, date_to, html_path, pdf_path):
+        super().__init__()
+        self.generator, self.args = generator, (date_from, date_to, html_path, pdf_path)
+        self.signals = ReportSignals()
+
+    def run(self):
+        try:
+            stats = self.generator.generate(*self.args, progress=self.signals.progress.emit)
+        except Exception as e:
+            self.signals.failed.emit(str(e)); return
+        self.signals.finished.emit(stats)
+
+class MaintenanceSignals(QObject):
+    finished = Signal(int)
+    failed = Signal(str)
+
+class MaintenanceTask(QRunnable):
+    """압축/해제(+VACUUM)를 QThreadPool에서 실행 - 작업 스레드 전용 DailyLogDB 연결 사용"""
+    def __init__(self, db_path, method, **kwargs):
+        super().__init__()
+        self.db_path, self.method, self.kwargs = db_path, method, kwargs
+        self.signals = MaintenanceSignals()
+
+    def run(self):
+        try:
+            db = DailyLogDB(self.db_path)
+            try: n = getattr(db, self.method)(**self.kwargs)
+            finally: db.close()
+        except Exception as e:
+            self.signals.failed.emit(str(e)); return
+        self.signals.finished.emit(n)
+
+def run_report(db_path, date_from, date_to, out_base):
+    """헤드리스 보고서 생성: out_base.html / out_base.pdf"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # 화면 없는 환경에서도 QPdfWriter 사용
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])
+    base = os.path.splitext(out_base)[0]
+    stats = ReportGenerator(db_path).generate(date_from, date_to, base + ".html", base + ".pdf")
+    print(f"보고서: {base}.html, {base}.pdf  ({stats['days']}일, 새로 렌더링 {stats['rendered']} / 캐시 {stats['cached']})")
+    return stats
+
 class HighlightDelegate(QStyledItemDelegate):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.query = ""
-        self.dark_mode = False
 
     def setQuery(self, q: str):
         self.query = (q or "").strip()
 
-    def setDarkMode(self, dark_mode: bool):
-        self.dark_mode = dark_mode
-
     def paint(self, painter, option, index):
         text = index.data() or ""
         selected_flag = getattr(QStyle.StateFlag, 'State_Selected', getattr(QStyle, 'State_Selected', 0))
         if selected_flag and (option.state & selected_flag):
             painter.fillRect(option.rect, option.palette.highlight())
 
-        import html, re as _re
-        safe = html.escape(str(text)).replace("\n", "<br>")
-        if self.query:
-            pat = _re.compile(_re.escape(self.query), _re.IGNORECASE)
-            safe = pat.sub(lambda m: f"<span style='background-color:#fde68a'>{html.escape(m.group(0))}</span>", safe)
-
-        if selected_flag and (option.state & selected_flag):
-            text_color = "#FFFFFF" if self.dark_mode else "#111827"
-        else:
-            text_color = "#111827" if not self.dark_mode else "#FFFFFF"
+        import html
+        text = str(text)
+        # 자모/초성 매칭 구간을 원문 글자 단위로 강조 (조합 중인 음절은 음절 전체)
+        pieces, last = [], 0
+        for a, b in (match_spans(text, self.query) if self.query else []):
+            pieces.append(html.escape(text[last:a]))
+            pieces.append(f"<span style='background-color:#fde68a'>{html.escape(text[a:b])}</span>")
+            last = b
+        pieces.append(html.escape(text[last:]))
+        safe = "".join(pieces).replace("\n", "<br>")
+
+        # 글자색은 테마 팔레트(QSS color / selection-color)에서 → 테마 전환 시 다시 채울 필요 없음
+        role = QPalette.HighlightedText if (selected_flag and (option.state & selected_flag)) else QPalette.Text
+        text_color = option.palette.color(role).name()
 
         doc = QTextDocument()
         doc.setHtml(f"<span style='color:{text_color}'>{safe}</span>")
@@ -199,6 +1039,78 @@ class HighlightDelegate(QStyledItemDelegate):
         h = int(doc.size().height()) + 10
         return QSize(width, h)
 
+class EntryTableModel(QAbstractTableModel):
+    """entries 리스트 모델 - 스크롤이 끝에 닿으면 fetchMore로 다음 keyset 페이지를 불러옴"""
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self._rows = []
+        self._has_more = False
+        self._filter = ("", None, None, None)  # (search_text, date_from, date_to, token)
+
+    def reset(self, search_text="", date_from=None, date_to=None, token=None):
+        self.beginResetModel()
+        self._filter = (search_text, date_from, date_to, token)
+        self._rows = self.db.get_page(None, PAGE_SIZE, *self._filter)
+        self._has_more = len(self._rows) == PAGE_SIZE
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more: return
+        page = self.db.get_page(self._rows[-1][0], PAGE_SIZE, *self._filter)
+        self._has_more = len(page) == PAGE_SIZE
+        if not page: return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def row_at(self, row: int):
+        return self._rows[row]
+
+    def apply_changes(self, dates):
+        """바뀐 날짜만 현재 필터로 다시 읽어 행 단위로 교체/삽입/제거 (전체 reset 없이)"""
+        fresh = {r[0]: r for r in self.db.get_rows(dates, *self._filter)}
+        # 아직 안 불러온 구간(마지막 행 이전)은 이후 fetchMore가 가져옴
+        floor = self._rows[-1][0] if (self._rows and self._has_more) else ""
+        pos = {r[0]: i for i, r in enumerate(self._rows)}
+        for iso in sorted(set(dates), reverse=True):
+            i, r = pos.get(iso), fresh.get(iso)
+            if i is not None and r is None:
+                self.beginRemoveRows(QModelIndex(), i, i); del self._rows[i]; self.endRemoveRows()
+            elif i is not None:
+                self._rows[i] = r
+                self.dataChanged.emit(self.index(i, 0), self.index(i, len(HEADERS) - 1))
+                continue
+            elif r is not None and iso > floor:
+                i = next((k for k, row in enumerate(self._rows) if row[0] < iso), len(self._rows))
+                self.beginInsertRows(QModelIndex(), i, i); self._rows.insert(i, r); self.endInsertRows()
+            else:
+                continue
+            pos = {row[0]: k for k, row in enumerate(self._rows)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid(): return None
+        if role == Qt.DisplayRole:
+            return str(self._rows[index.row()][index.column() + 1] or "")
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignLeft | Qt.AlignTop)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
 def gb(title, widget):
     box = QGroupBox(title)
     lay = QVBoxLayout(box)
@@ -208,6 +1120,206 @@ def gb(title, widget):
     box.setGraphicsEffect(QGraphicsDropShadowEffect(blurRadius=16, xOffset=0, yOffset=2))
     return box
 
+# ===== Activity Dashboard =====
+HEATMAP_COLORS = ["#BBF7D0", "#4ADE80", "#16A34A", "#065F46"]
+
+def activity_daily_frame(rows):
+    """activity_log 행 → 날짜 × 활동 횟수 피벗 (DatetimeIndex, 열 = ACTIVITIES)"""
+    import pandas as pd
+    df = pd.DataFrame(rows, columns=["date", "activity", "count"])
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    df = df.dropna(subset=["date"])
+    return (df.pivot_table(index="date", columns="activity", values="count", aggfunc="sum", fill_value=0)
+              .reindex(columns=ACTIVITIES, fill_value=0).sort_index())
+
+def activity_streaks(daily, today: date):
+    """활동별 (현재 연속 일수, 최장 연속 일수) - 날짜 차분 + 누적합으로 구간을 나눠 한 번에 계산"""
+    import numpy as np
+    out = {}
+    today_ord = today.toordinal()
+    ords_all = np.array([d.toordinal() for d in daily.index.date], dtype=np.int64)
+    for act in daily.columns:
+        ords = ords_all[daily[act].to_numpy() > 0]
+        if ords.size == 0:
+            out[act] = (0, 0); continue
+        run_id = np.concatenate(([0], np.cumsum(np.diff(ords) != 1)))
+        lengths = np.bincount(run_id)
+        # 오늘 아직 기록 전이면 어제까지 이어진 연속도 '현재'로 봄
+        current = int(lengths[-1]) if ords[-1] >= today_ord - 1 else 0
+        out[act] = (current, int(lengths.max()))
+    return out
+
+class ActivityHeatmap(QWidget):
+    """연간 캘린더 히트맵 (열 = 주, 행 = 요일 월~일)"""
+    CELL, GAP = 12, 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.year = date.today().year
+        self.values = {}  # date → 횟수
+        self.setMouseTracking(True)
+        self.setMinimumSize(self._col_x(54) + 30, 30 + 7 * (self.CELL + self.GAP))
+
+    def set_data(self, year: int, values: dict):
+        self.year, self.values = year, values
+        self.update()
+
+    def _col_x(self, col):
+        return 30 + col * (self.CELL + self.GAP)
+
+    def _cell(self, d: date):
+        start = date(self.year, 1, 1)
+        col = (d.toordinal() - (start.toordinal() - start.weekday())) // 7
+        return QRectF(self._col_x(col), 20 + d.weekday() * (self.CELL + self.GAP), self.CELL, self.CELL)
+
+    def _days(self):
+        d, end = date(self.year, 1, 1), date(self.year, 12, 31)
+        while d <= end:
+            yield d
+            d += timedelta(days=1)
+
+    def paintEvent(self, event):
+        p = QPainter(self); p.setRenderHint(QPainter.Antialiasing)
+        top = max(self.values.values(), default=0)
+        empty = QColor(self.palette().color(QPalette.Text)); empty.setAlpha(28)
+        p.setPen(self.palette().color(QPalette.Text))
+        for i, wd in enumerate(WEEKDAY_KR):
+            if i % 2 == 0: p.drawText(QRectF(0, 20 + i * (self.CELL + self.GAP) - 2, 26, self.CELL + 4), Qt.AlignRight | Qt.AlignVCenter, wd)
+        p.setPen(Qt.NoPen)
+        for d in self._days():
+            v = self.values.get(d, 0)
+            if d.day == 1:
+                p.setPen(self.palette().color(QPalette.Text))
+                p.drawText(QRectF(self._cell(d).x(), 0, 40, 16), Qt.AlignLeft | Qt.AlignVCenter, f"{d.month}월")
+                p.setPen(Qt.NoPen)
+            p.setBrush(QColor(HEATMAP_COLORS[min(3, (v * 4 - 1) // top)]) if v and top else empty)
+            p.drawRoundedRect(self._cell(d), 2, 2)
+        p.end()
+
+    def mouseMoveEvent(self, event):
+        pos = event.position() if hasattr(event, "position") else event.pos()
+        for d in self._days():
+            if self._cell(d).contains(pos):
+                QToolTip.showText(event.globalPosition().toPoint() if hasattr(event, "globalPosition") else event.globalPos(),
+                                  f"{d.isoformat()} ({WEEKDAY_KR[d.weekday()]}): {self.values.get(d, 0)}회", self)
+                return
+        QToolTip.hideText()
+
+class ActivityDashboard(QDialog):
+    """Daily Log 칩 활동 통계 - 주/월 횟수, 연속 기록, 히트맵 (activity_log 집계만 사용)"""
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("활동 통계 대시보드")
+        self.resize(980, 640)
+        self.daily = activity_daily_frame(db.get_activity_counts())
+
+        lay = QVBoxLayout(self); lay.setContentsMargins(16, 12, 16, 16); lay.setSpacing(10)
+        top = QHBoxLayout(); top.setSpacing(6)
+        self.year_combo = QComboBox(); self.act_combo = QComboBox()
+        years = sorted({d.year for d in self.daily.index.date} | {date.today().year}, reverse=True)
+        self.year_combo.addItems([str(y) for y in years])
+        self.act_combo.addItems(["전체"] + ACTIVITIES)
+        self.year_combo.currentIndexChanged.connect(self._update_heatmap); self.act_combo.currentIndexChanged.connect(self._update_heatmap)
+        top.addWidget(QLabel("연도")); top.addWidget(self.year_combo); top.addWidget(QLabel("활동")); top.addWidget(self.act_combo); top.addStretch(1)
+        lay.addLayout(top)
+
+        self.heatmap = ActivityHeatmap()
+        lay.addWidget(gb("캘린더 히트맵", self.heatmap))
+        self.summary = self._make_table(["활동", "이번 주", "이번 달", "올해", "전체", "현재 연속(일)", "최장 연속(일)"])
+        lay.addWidget(gb("요약", self.summary))
+        tables = QHBoxLayout(); tables.setSpacing(10)
+        self.weekly = self._make_table(["주 (월요일)"] + ACTIVITIES)
+        tables.addWidget(gb("주별 횟수 (최근 12주)", self.weekly))
+        self.monthly = self._make_table(["월"] + ACTIVITIES)
+        tables.addWidget(gb("월별 횟수 (최근 12개월)", self.monthly))
+        lay.addLayout(tables, 1)
+
+        self._fill_tables()
+        self._update_heatmap()
+
+    @staticmethod
+    def _make_table(headers):
+        t = QTableWidget(0, len(headers)); t.setHorizontalHeaderLabels(headers)
+        t.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch); t.verticalHeader().setVisible(False)
+        t.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        return t
+
+    @staticmethod
+    def _set_rows(table, rows):
+        table.setRowCount(len(rows))
+        for r, vals in enumerate(rows):
+            for c, v in enumerate(vals):
+                item = QTableWidgetItem(str(v)); item.setTextAlignment(Qt.AlignCenter)
+                table.setItem(r, c, item)
+
+    def _fill_tables(self):
+        import pandas as pd
+        today = date.today(); daily = self.daily
+        week_start = pd.Timestamp(today - timedelta(days=today.weekday()))
+        month_start = pd.Timestamp(today.replace(day=1)); year_start = pd.Timestamp(today.replace(month=1, day=1))
+        this_week = daily[daily.index >= week_start].sum()
+        this_month = daily[daily.index >= month_start].sum()
+        this_year = daily[daily.index >= year_start].sum()
+        total = daily.sum()
+        streaks = activity_streaks(daily, today)
+        self._set_rows(self.summary, [
+            [a, int(this_week.get(a, 0)), int(this_month.get(a, 0)), int(this_year.get(a, 0)), int(total.get(a, 0)), *streaks[a]]
+            for a in ACTIVITIES])
+        # 월요일 시작 주 (라벨 = 그 주 월요일)
+        weekly = daily.resample("W-MON", label="left", closed="left").sum() if len(daily) else daily
+        weekly = weekly[weekly.index >= week_start - pd.Timedelta(weeks=11)].sort_index(ascending=False)
+        self._set_rows(self.weekly, [[ts.strftime("%Y-%m-%d")] + [int(v) for v in row] for ts, row in zip(weekly.index, weekly.to_numpy())])
+        monthly = daily.resample("MS").sum() if len(daily) else daily
+        monthly = monthly[monthly.index >= pd.Timestamp(month_start) - pd.DateOffset(months=11)].sort_index(ascending=False)
+        self._set_rows(self.monthly, [[ts.strftime("%Y-%m")] + [int(v) for v in row] for ts, row in zip(monthly.index, monthly.to_numpy())])
+
+    def _update_heatmap(self):
+        year = int(self.year_combo.currentText() or date.today().year)
+        act = self.act_combo.currentText()
+        part = self.daily[self.daily.index.year == year]
+        series = part.sum(axis=1) if act == "전체" else part[act]
+        series = series[series > 0]
+        self.heatmap.set_data(year, dict(zip(series.index.date, series.astype(int).tolist())))
+
+# ===== Watchlist Panel =====
+class WatchlistPanel(QWidget):
+    """관심주 역색인(interest_postings) 집계 - 처음/마지막 등장, 등장 일수, ⭐ 횟수. 종목 클릭 → 리스트 필터"""
+    tokenActivated = Signal(str)
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        lay = QVBoxLayout(self); lay.setContentsMargins(8, 8, 8, 8); lay.setSpacing(6)
+        self.filter_edit = QLineEdit(); self.filter_edit.setPlaceholderText("종목 찾기")
+        self.filter_edit.textChanged.connect(self._apply_filter)
+        self.table = QTableWidget(0, 5)
+        self.table.setHorizontalHeaderLabels(["종목", "처음", "마지막", "일수", "⭐"])
+        hh = self.table.horizontalHeader(); hh.setSectionResizeMode(QHeaderView.ResizeToContents); hh.setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(2, Qt.DescendingOrder)  # 기본: 최근 등장 순
+        self.table.cellClicked.connect(lambda row, _: self.tokenActivated.emit(self.table.item(row, 0).text()))
+        lay.addWidget(self.filter_edit); lay.addWidget(self.table)
+
+    def refresh(self):
+        rows = self.db.get_watchlist()
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for r, (token, first, last, days, starred) in enumerate(rows):
+            for c, v in enumerate((token, first, last, days, starred or 0)):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, v)  # 숫자 열은 숫자로 정렬
+                self.table.setItem(r, c, item)
+        self.table.setSortingEnabled(True)
+        self._apply_filter(self.filter_edit.text())
+
+    def _apply_filter(self, text):
+        key = (text or "").strip().casefold()
+        for r in range(self.table.rowCount()):
+            self.table.setRowHidden(r, bool(key) and key not in self.table.item(r, 0).text().casefold())
+
 class MainWindow(QMainWindow):
     VIEW_LIST = 0
     VIEW_CAL  = 1
@@ -259,6 +1371,17 @@ class MainWindow(QMainWindow):
         self.search_edit.setPlaceholderText("검색 (모든 컬럼)"); self.search_edit.setMinimumWidth(300)
         self.search_edit.textChanged.connect(self.refresh_table)
 
+        # 기간 필터 (전체 / 최근 30일 / 올해 / 직접 지정)
+        self.range_combo = QComboBox(); self.range_combo.setObjectName("range_combo")
+        self.range_combo.addItems(["전체 기간", "최근 30일", "올해", "직접 지정"])
+        self.range_combo.setFixedHeight(28)
+        self.range_from = QDateEdit(); self.range_to = QDateEdit()
+        for de in (self.range_from, self.range_to):
+            de.setDisplayFormat("yyyy-MM-dd"); de.setCalendarPopup(True); de.setFixedHeight(28); de.setVisible(False)
+        self.range_from.setDate(QDate.currentDate().addMonths(-1)); self.range_to.setDate(QDate.currentDate())
+        self.range_from.dateChanged.connect(self.refresh_table); self.range_to.dateChanged.connect(self.refresh_table)
+        self.range_combo.currentIndexChanged.connect(self.on_range_changed)
+
         # --- Buttons (변경 포인트) ---
         # 좌측 뷰 전환 버튼: "내보내기"처럼 success(초록) 채움 + 토글
         self.btn_toggle_view = QPushButton("📅 캘린더 보기")
@@ -282,6 +1405,17 @@ class MainWindow(QMainWindow):
         self.btn_export.clicked.connect(self.on_export_excel)
 
         tb_layout.addWidget(self.search_edit, 0)
+        tb_layout.addWidget(self.range_combo, 0)
+        tb_layout.addWidget(self.range_from, 0)
+        tb_layout.addWidget(self.range_to, 0)
+
+        # 관심주 필터 (워치리스트에서 종목 클릭 시 표시, 누르면 해제)
+        self.token_filter = None
+        self.btn_token_filter = QPushButton(); self.btn_token_filter.setProperty("variant", "chip")
+        self.btn_token_filter.setFixedHeight(28); self.btn_token_filter.setCursor(Qt.PointingHandCursor); self.btn_token_filter.setVisible(False)
+        self.btn_token_filter.setToolTip("관심주 필터 해제")
+        self.btn_token_filter.clicked.connect(lambda: self.set_token_filter(None))
+        tb_layout.addWidget(self.btn_token_filter, 0)
         tb_layout.addWidget(self.btn_toggle_view, 0)
         tb_layout.addWidget(self.btn_import, 0)
         tb_layout.addWidget(self.btn_export, 0)
@@ -296,8 +1430,9 @@ class MainWindow(QMainWindow):
 
         # 1) List(Table)
         list_wrap = QWidget(); left_layout = QVBoxLayout(list_wrap); left_layout.setContentsMargins(0,0,0,0); left_layout.setSpacing(10)
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["날짜", "Daily Log", "주식 거래내역", "남은 주식 수(증권사별)", "주식 고려사항", "관심 주"])
+        self.table = QTableView()
+        self.model = EntryTableModel(self.db, self.table)
+        self.table.setModel(self.model)
         self.table.setWordWrap(True)
         try: self.table.setTextElideMode(Qt.ElideNone)
         except Exception: pass
@@ -309,7 +1444,7 @@ class MainWindow(QMainWindow):
         try: self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         except Exception: pass
         self.table.setAlternatingRowColors(True)
-        self.table.cellClicked.connect(self.on_row_clicked)
+        self.table.clicked.connect(self.on_row_clicked)
         self.hl_delegate = HighlightDelegate(self.table)
         self.table.setItemDelegate(self.hl_delegate)
         left_layout.addWidget(self.table)
@@ -343,11 +1478,7 @@ class MainWindow(QMainWindow):
 
         form.addWidget(gb("Daily Log", self.daily_log_edit))
         self._add_chip_toolbar(form.itemAt(form.count()-1).widget().layout(), [
-            ("🍲 점심", self.daily_log_edit, "🍲 점심: "),
-            ("🚶 점심운동", self.daily_log_edit, "🚶 점심운동: "),
-            ("👟 운동", self.daily_log_edit, "👟 운동: "),
-            ("🌳 산책", self.daily_log_edit, "🌳 산책: "),
-            ("📖 독서", self.daily_log_edit, "📖 독서: "),
+            (f"{emoji} {name}", self.daily_log_edit, f"{emoji} {name}: ") for emoji, name in ACTIVITY_CHIPS
         ])
         form.addWidget(gb("주식 거래내역", self.trades_edit))
         self._add_chip_toolbar(form.itemAt(form.count()-1).widget().layout(), [
@@ -372,7 +1503,7 @@ class MainWindow(QMainWindow):
         ])
 
         btn_row = QHBoxLayout(); btn_row.setSpacing(6)
-        self.btn_save = QPushButton(" 저장"); btn_delete = QPushButton(" 선택 날짜 삭제"); btn_clear = QPushButton(" 폼 지우기")
+        self.btn_save = QPushButton(" 저장"); self.btn_delete = btn_delete = QPushButton(" 선택 날짜 삭제"); btn_clear = QPushButton(" 폼 지우기")
         self.btn_save.setIcon(self.style().standardIcon(QStyle.SP_DialogApplyButton))
         btn_delete.setIcon(self.style().standardIcon(QStyle.SP_TrashIcon))
         btn_clear.setIcon(self.style().standardIcon(QStyle.SP_DialogResetButton))
@@ -394,11 +1525,27 @@ class MainWindow(QMainWindow):
         container_layout.addWidget(self.topbar); container_layout.addWidget(central)
         self.setCentralWidget(container)
 
+        # 관심주 워치리스트 (우측 도크, 보기 메뉴에서 열기)
+        self.watchlist = WatchlistPanel(self.db)
+        self.watchlist.tokenActivated.connect(self.set_token_filter)
+        self.watch_dock = QDockWidget("관심주 워치리스트", self); self.watch_dock.setObjectName("watchlistDock")
+        self.watch_dock.setWidget(self.watchlist); self.watch_dock.setMinimumWidth(380)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.watch_dock)
+        self.watch_dock.visibilityChanged.connect(lambda shown: shown and self.watchlist.refresh())
+        self.watch_dock.hide()
+
+        for w in (self.daily_log_edit, self.trades_edit, self.holdings_edit, self.consider_edit, self.interest_edit):
+            w.textChanged.connect(self._mark_form_dirty)
+        self._form_stamp, self._form_dirty = (None, None), False
+        self._marked_dates = set()
+
         self._build_menubar()
         self.apply_theme(light_mode=not self.dark_mode)
         self.refresh_table()
         self.refresh_calendar_marks()
         self._update_save_mode(self.overwrite_chk.isChecked())
+        self._set_form_loaded(normalize_date("")[0])
+        self._start_external_watch()
         self._show_db_path()
 
     # ===== Left view handling =====
@@ -429,35 +1576,62 @@ class MainWindow(QMainWindow):
         else:
             for w in (self.daily_log_edit, self.trades_edit, self.holdings_edit, self.consider_edit, self.interest_edit):
                 w.clear()
+        self._set_form_loaded(iso)
         self.statusBar().showMessage(f"캘린더 선택: {label}", 2000)
 
     def refresh_calendar_marks(self):
+        # 이전에 표시한 날짜와 비교해 추가/삭제된 날짜만 서식 변경
+        dates = set(self.db.get_all_dates())
+        self._patch_calendar_marks(dates - self._marked_dates, self._marked_dates - dates)
+
+    def _patch_calendar_marks(self, added, removed):
         self.calendar.setWeekdayTextFormat(Qt.Monday, QTextCharFormat())
         fmt = QTextCharFormat()
         fmt.setBackground(QColor("#DCFCE7"))
         fmt.setForeground(QColor("#065F46"))
-        for iso in self.db.get_all_dates():
+        for iso, f in [(i, fmt) for i in added] + [(i, QTextCharFormat()) for i in removed]:
             try:
                 y,m,d = map(int, iso.split("-"))
                 qd = QDate(y,m,d)
-                self.calendar.setDateTextFormat(qd, fmt)
+                self.calendar.setDateTextFormat(qd, f)
             except Exception:
                 continue
+        self._marked_dates = (self._marked_dates | set(added)) - set(removed)
 
     # ===== Table/List =====
+    def on_range_changed(self, idx: int):
+        custom = idx == RANGE_CUSTOM
+        self.range_from.setVisible(custom); self.range_to.setVisible(custom)
+        self.refresh_table()
+
+    def _current_range(self):
+        # (date_from, date_to) ISO 문자열, 제한 없으면 None
+        idx = self.range_combo.currentIndex()
+        today = date.today()
+        if idx == RANGE_30D:
+            return (today - timedelta(days=30)).isoformat(), today.isoformat()
+        if idx == RANGE_YEAR:
+            return f"{today.year}-01-01", f"{today.year}-12-31"
+        if idx == RANGE_CUSTOM:
+            a = self.range_from.date().toString("yyyy-MM-dd"); b = self.range_to.date().toString("yyyy-MM-dd")
+            return (a, b) if a <= b else (b, a)
+        return None, None
+
+    def set_token_filter(self, token):
+        # 관심주 역색인으로 리스트 필터 (LIKE 스캔 없이 interest_postings PK 조회)
+        self.token_filter = token or None
+        self.btn_token_filter.setText(f"✕ 관심주: {token}" if token else "")
+        self.btn_token_filter.setVisible(bool(token))
+        if token and self.btn_toggle_view.isChecked(): self.btn_toggle_view.setChecked(False)  # 리스트 보기로
+        self.refresh_table()
+
+    def _refresh_watchlist(self):
+        if self.watch_dock.isVisible(): self.watchlist.refresh()
+
     def refresh_table(self):
         q = self.search_edit.text().strip()
         self.hl_delegate.setQuery(q)
-        self.hl_delegate.setDarkMode(self.dark_mode)
-        rows = self.db.get_all(q)
-        self.table.setRowCount(0)
-        for r in rows:
-            row = self.table.rowCount(); self.table.insertRow(row)
-            for c, val in enumerate([r[1], r[2], r[3], r[4], r[5], r[6]]):
-                item = QTableWidgetItem(str(val or ""))
-                item.setTextAlignment(Qt.AlignLeft | Qt.AlignTop)
-                item.setForeground(QColor("#FFFFFF" if self.dark_mode else "#111827"))
-                self.table.setItem(row, c, item)
+        self.model.reset(q, *self._current_range(), self.token_filter)
         try: self.table.resizeRowsToContents()
         except Exception: pass
 
@@ -506,8 +1680,14 @@ class MainWindow(QMainWindow):
         # 파일
         m_file = mb.addMenu("파일(&F)")
         act_import = QAction("불러오기(엎기)", self); act_export = QAction("내보내기", self); act_exit = QAction("종료(Exit)", self)
+        act_report = QAction("보고서 만들기 (HTML/PDF)", self)
         act_import.triggered.connect(self.on_import_excel); act_export.triggered.connect(self.on_export_excel); act_exit.triggered.connect(self.close)
-        m_file.addAction(act_import); m_file.addAction(act_export); m_file.addSeparator(); m_file.addAction(act_exit)
+        act_report.triggered.connect(self.on_make_report)
+        act_compress = QAction(f"오래된 항목 압축 ({ARCHIVE_AFTER_MONTHS}개월 이전)", self); act_decompress = QAction("압축 모두 해제", self)
+        act_compress.triggered.connect(self.on_compress_archived); act_decompress.triggered.connect(self.on_decompress_all)
+        self._maintenance_actions = (act_compress, act_decompress, act_import)
+        m_file.addAction(act_import); m_file.addAction(act_export); m_file.addAction(act_report); m_file.addSeparator()
+        m_file.addAction(act_compress); m_file.addAction(act_decompress); m_file.addSeparator(); m_file.addAction(act_exit)
         # 편집
         m_edit = mb.addMenu("편집(&E)")
         act_clear = QAction("폼 지우기(Clear Form)", self); act_delete = QAction("선택 삭제(Delete Entry)", self)
@@ -520,12 +1700,26 @@ class MainWindow(QMainWindow):
         self.act_toggle_left = QAction("좌측 뷰 전환 (리스트/캘린더)", self)
         self.act_toggle_left.triggered.connect(self.toggle_left_view)
         m_view.addAction(self.act_toggle_left)
+        m_view.addSeparator()
+        act_watch = self.watch_dock.toggleViewAction(); act_watch.setText("관심주 워치리스트")
+        m_view.addAction(act_watch)
+        act_stats = QAction("활동 통계 대시보드", self)
+        act_stats.triggered.connect(self.show_activity_dashboard)
+        m_view.addAction(act_stats)
         # 도움말
         m_help = mb.addMenu("도움말(&H)")
         act_readme = QAction("README 열기", self); act_about = QAction("버전 정보(About)", self)
         act_readme.triggered.connect(self.open_readme); act_about.triggered.connect(self.show_about)
         m_help.addAction(act_readme); m_help.addAction(act_about)
 
+    def show_activity_dashboard(self):
+        try:
+            dlg = ActivityDashboard(self.db, self)
+        except ImportError as e:
+            QMessageBox.warning(self, "활동 통계", f"pandas가 필요합니다.\n\n세부: {e}"); return
+        dlg.setAttribute(Qt.WA_DeleteOnClose)
+        dlg.show()
+
     def open_readme(self):
         for fname in ("README.txt", "README.md"):
             fpath = os.path.join(os.getcwd(), fname)
@@ -549,9 +1743,8 @@ class MainWindow(QMainWindow):
 
     def toggle_theme(self, on: bool):
         self.dark_mode = bool(on)
+        # 캐시된 QSS/팔레트만 교체 - DB 조회나 행 재구성 없음 (셀 글자색은 델리게이트가 팔레트에서 읽음)
         self.apply_theme(light_mode=not self.dark_mode)
-        self.hl_delegate.setDarkMode(self.dark_mode)
-        self.refresh_table(); self.refresh_calendar_marks()
         self.table.viewport().update()
         self._show_db_path()
 
@@ -561,14 +1754,15 @@ class MainWindow(QMainWindow):
             2500
         )
 
-    def on_row_clicked(self, row, col):
-        date_label = self.table.item(row, 0).text(); iso = date_label[:10]
-        self.date_edit.setDate(QDate.fromString(iso, "yyyy-MM-dd"))
-        self.daily_log_edit.setPlainText(self.table.item(row, 1).text())
-        self.trades_edit.setPlainText(self.table.item(row, 2).text())
-        self.holdings_edit.setPlainText(self.table.item(row, 3).text())
-        self.consider_edit.setPlainText(self.table.item(row, 4).text())
-        self.interest_edit.setPlainText(self.table.item(row, 5).text())
+    def on_row_clicked(self, index):
+        r = self.model.row_at(index.row())
+        self.date_edit.setDate(QDate.fromString(r[0], "yyyy-MM-dd"))
+        self.daily_log_edit.setPlainText(r[2] or "")
+        self.trades_edit.setPlainText(r[3] or "")
+        self.holdings_edit.setPlainText(r[4] or "")
+        self.consider_edit.setPlainText(r[5] or "")
+        self.interest_edit.setPlainText(r[6] or "")
+        self._set_form_loaded(r[0])
 
     def _collect_form_vals(self):
         return {
@@ -582,31 +1776,201 @@ class MainWindow(QMainWindow):
     def on_save(self):
         iso, label = normalize_date(self.date_edit.date().toString("yyyy-MM-dd"))
         vals = self._collect_form_vals()
+        if self._form_stamp[0] == iso and self.db.get_updated_at(iso) != self._form_stamp[1]:
+            if QMessageBox.warning(self, "변경 충돌", f"{label} 항목이 폼을 불러온 뒤 다른 곳(다른 기기/프로그램)에서 수정되었습니다.\n그래도 저장할까요?",
+                                   QMessageBox.Yes | QMessageBox.No, QMessageBox.No) != QMessageBox.Yes:
+                self.statusBar().showMessage("저장 취소됨 (외부 변경)", 2000)
+                return
         if self.overwrite_chk.isChecked():
             if QMessageBox.question(self, "덮어쓰기 확인", f"{label} 항목을 현재 폼 내용으로 완전히 대체할까요?\n(빈 칸은 빈 값으로 저장)", QMessageBox.Yes | QMessageBox.No, QMessageBox.No) != QMessageBox.Yes:
                 self.statusBar().showMessage("덮어쓰기 취소됨", 1500)
                 return
-            self.db.overwrite(iso, label, vals)
-            self.statusBar().showMessage(f"{label} 덮어쓰기 완료", 2000)
-        else:
-            vals = {k: v.strip() for k, v in vals.items()}
-            self.db.upsert_merge(iso, label, vals)
-            self.statusBar().showMessage(f"{label} 저장(병합) 완료", 2000)
-        self.refresh_table(); self.refresh_calendar_marks()
+        try:
+            if self.overwrite_chk.isChecked():
+                self.db.overwrite(iso, label, vals)
+            else:
+                self.db.upsert_merge(iso, label, {k: v.strip() for k, v in vals.items()})
+        except sqlite3.OperationalError as e:
+            self._warn_db_busy("저장", e); return
+        self.statusBar().showMessage(f"{label} 덮어쓰기 완료" if self.overwrite_chk.isChecked() else f"{label} 저장(병합) 완료", 2000)
+        self._form_stamp = (iso, self.db.get_updated_at(iso)); self._form_dirty = False
+        self.refresh_table(); self.refresh_calendar_marks(); self._refresh_watchlist()
 
     def on_delete(self):
         iso, label = normalize_date(self.date_edit.date().toString("yyyy-MM-dd"))
         if QMessageBox.question(self, "삭제 확인", f"{label} 항목을 삭제할까요?") == QMessageBox.Yes:
-            self.db.delete(iso)
-            self.refresh_table(); self.refresh_calendar_marks()
+            try: self.db.delete(iso)
+            except sqlite3.OperationalError as e:
+                self._warn_db_busy("삭제", e); return
+            self._set_form_loaded(iso)  # 폼에 남은 내용을 다시 저장해도 충돌로 보지 않음
+            self.refresh_table(); self.refresh_calendar_marks(); self._refresh_watchlist()
             self.statusBar().showMessage(f"{label} 삭제 완료", 2000)
 
+    def _warn_db_busy(self, what, err):
+        # 다른 기기/프로그램이 DB를 잠그고 있음 (database is locked 등) - 폼 내용은 그대로 두고 알림
+        self.db.conn.rollback()
+        QMessageBox.warning(self, f"{what} 실패", f"DB를 지금 쓸 수 없습니다: {err}\n폼 내용은 그대로 있으니 잠시 후 다시 시도하세요.")
+        self.statusBar().showMessage(f"{what} 실패 (DB 사용 중)", 3000)
+
     def on_clear_form(self):
         self.date_edit.setDate(QDate.currentDate())
         for w in (self.daily_log_edit, self.trades_edit, self.holdings_edit, self.consider_edit, self.interest_edit):
             w.clear()
+        self._set_form_loaded(normalize_date("")[0])
         self.statusBar().showMessage("폼을 초기화했습니다", 1500)
 
+    def _set_form_loaded(self, iso):
+        # 폼에 불러온 날짜와 그때의 updated_at - 외부 변경 충돌 판단 기준
+        self._form_stamp = (iso, self.db.get_updated_at(iso))
+        self._form_dirty = False
+
+    def _mark_form_dirty(self):
+        self._form_dirty = True
+
+    # ===== External change detection (동기화 폴더의 다른 기기 등) =====
+    def _db_identity(self):
+        try:
+            st = os.stat(self.db_path); return (st.st_dev, st.st_ino)
+        except OSError:
+            return None
+
+    def _start_external_watch(self):
+        self._data_version = self.db.data_version()
+        self._watermark = self._clamp_watermark(self.db.max_updated_at())
+        self._db_ident = self._db_identity()
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.addPaths([p for p in (self.db_path, os.path.dirname(self.db_path)) if os.path.exists(p)])
+        self._ext_debounce = QTimer(self); self._ext_debounce.setSingleShot(True); self._ext_debounce.setInterval(300)
+        self._ext_debounce.timeout.connect(self._check_external_changes)
+        self._fs_watcher.fileChanged.connect(lambda _: self._ext_debounce.start())
+        self._fs_watcher.directoryChanged.connect(lambda _: self._ext_debounce.start())
+        # 파일 이벤트가 안 오는 환경(네트워크/동기화 드라이브) 대비: data_version 폴링 (쿼리 하나라 가벼움)
+        self._ext_poll = QTimer(self); self._ext_poll.setInterval(EXTERNAL_POLL_MS)
+        self._ext_poll.timeout.connect(self._check_external_changes)
+        self._ext_poll.start()
+
+    def _check_external_changes(self):
+        if os.path.exists(self.db_path) and self.db_path not in self._fs_watcher.files():
+            self._fs_watcher.addPath(self.db_path)  # 파일 교체 시 감시가 풀리므로 다시 등록
+        ident = self._db_identity()
+        if ident is not None and ident != self._db_ident:
+            # 동기화 도구가 파일을 통째로 교체 → 새 파일로 다시 연결
+            self._db_ident = ident
+            self.db.close(); self.db = DailyLogDB(self.db_path)
+            self.model.db = self.watchlist.db = self.db
+            self._data_version = self.db.data_version(); self._watermark = self._clamp_watermark(self.db.max_updated_at())
+            self.refresh_table(); self.refresh_calendar_marks(); self._refresh_watchlist()
+            self._check_form_conflict({self._form_stamp[0]})
+            self.statusBar().showMessage("DB 파일이 외부에서 교체되어 다시 불러왔습니다", 3000)
+            return
+        try:
+            dv = self.db.data_version()
+        except sqlite3.Error:
+            return
+        if dv == self._data_version: return
+        self._data_version = dv
+        self.db._sync_indexes()  # 인덱스를 안 챙기는 외부 writer(이전 버전 등) 대비
+        changed = self.db.get_changed_since(self._watermark)
+        if changed: self._watermark = self._clamp_watermark(max(self._watermark, changed[-1][1] or ""))
+        dates = set(self.db.get_all_dates())
+        added, removed = dates - self._marked_dates, self._marked_dates - dates
+        touched = {iso for iso, _ in changed} | removed
+        if touched:
+            self.model.apply_changes(touched)
+        else:
+            # 변경은 있었지만 워터마크 이후 행이 없음 (다른 기기 시계가 늦은 경우 등) → 보이는 페이지만 다시
+            self.refresh_table()
+        self._patch_calendar_marks(added, removed)
+        self._refresh_watchlist()
+        self._check_form_conflict(touched or {self._form_stamp[0]})
+        self.statusBar().showMessage(f"외부 변경 반영: {len(touched)}일", 2500)
+
+    @staticmethod
+    def _clamp_watermark(stamp):
+        # 시계가 앞선 기기가 쓴 updated_at(예: 2099-01-01)에 워터마크가 묶이지 않게 로컬 현재 시각까지만
+        return min(stamp or "", datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3])
+
+    def _check_form_conflict(self, touched):
+        iso = self._form_stamp[0]
+        if iso not in touched: return
+        now = self.db.get_updated_at(iso)
+        if now == self._form_stamp[1]: return
+        _, label = normalize_date(iso)
+        if self._form_dirty:
+            ans = QMessageBox.warning(
+                self, "변경 충돌",
+                f"편집 중인 {label} 항목이 다른 곳에서 수정되었습니다.\n\n"
+                "예: 외부 변경 내용을 불러오기 (내 편집은 버림)\n아니오: 내 편집 유지 (저장 시 다시 확인)",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if ans != QMessageBox.Yes: return
+        self._reload_form(iso)
+        self.statusBar().showMessage(f"{label} 외부 변경 내용을 불러왔습니다", 2500)
+
+    def _reload_form(self, iso):
+        row = self.db.get_by_date(iso)
+        for w, v in zip((self.daily_log_edit, self.trades_edit, self.holdings_edit, self.consider_edit, self.interest_edit),
+                        (row[1:] if row else [""] * 5)):
+            w.setPlainText(v or "")
+        self._set_form_loaded(iso)
+
+    # ===== Reports =====
+    def on_make_report(self):
+        dlg = QDialog(self); dlg.setWindowTitle("보고서 만들기")
+        lay = QVBoxLayout(dlg); row = QHBoxLayout(); row.setSpacing(6)
+        d_from, d_to = QDateEdit(), QDateEdit()
+        for de in (d_from, d_to): de.setDisplayFormat("yyyy-MM-dd"); de.setCalendarPopup(True)
+        # 기본: 지난달 (월간 리뷰)
+        first = QDate.currentDate().addMonths(-1); first = QDate(first.year(), first.month(), 1)
+        d_from.setDate(first); d_to.setDate(first.addMonths(1).addDays(-1))
+        row.addWidget(QLabel("기간")); row.addWidget(d_from); row.addWidget(QLabel("~")); row.addWidget(d_to)
+        lay.addLayout(row)
+        btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        btns.accepted.connect(dlg.accept); btns.rejected.connect(dlg.reject)
+        lay.addWidget(btns)
+        if dlg.exec() != QDialog.Accepted: return
+        a, b = d_from.date().toString("yyyy-MM-dd"), d_to.date().toString("yyyy-MM-dd")
+        if a > b: a, b = b, a
+        path, _ = QFileDialog.getSaveFileName(self, "보고서 저장 (HTML + PDF)", f"Daily_Log_Report_{a}_{b}.pdf", "PDF (*.pdf)")
+        if not path: return
+        base = os.path.splitext(path)[0]
+        task = ReportTask(ReportGenerator(self.db_path), a, b, base + ".html", base + ".pdf")
+        task.signals.progress.connect(lambda done, total: self.statusBar().showMessage(f"보고서 생성 중... {done}/{total}일"))
+        task.signals.finished.connect(lambda st: self.statusBar().showMessage(
+            f"보고서 저장됨: {base}.pdf ({st['days']}일, 새로 렌더링 {st['rendered']} / 캐시 {st['cached']})", 5000))
+        task.signals.failed.connect(lambda msg: QMessageBox.critical(self, "오류", f"보고서 생성 중 오류: {msg}"))
+        self._report_signals = task.signals  # 작업이 끝날 때까지 시그널 객체 유지
+        QThreadPool.globalInstance().start(task)
+        self.statusBar().showMessage("보고서 생성 시작...", 2000)
+
+    # ===== Archive compression =====
+    def on_compress_archived(self):
+        if QMessageBox.question(
+            self, "오래된 항목 압축",
+            f"{ARCHIVE_AFTER_MONTHS}개월보다 오래된 항목의 긴 텍스트를 압축해 DB 크기를 줄입니다.\n"
+            "앱에서는 그대로 보이지만, 이전 버전이나 다른 도구로 DB를 직접 열면 압축된 칸은 읽을 수 없습니다.\n진행할까요?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No) != QMessageBox.Yes:
+            return
+        before = os.path.getsize(self.db_path)
+        self._run_maintenance("압축", "compress_archived", lambda n: self.statusBar().showMessage(
+            f"{n}일 압축 완료 - DB {before // 1024:,} KB → {os.path.getsize(self.db_path) // 1024:,} KB", 5000))
+
+    def on_decompress_all(self):
+        self._run_maintenance("압축 해제", "decompress_all", lambda n: self.statusBar().showMessage(f"{n}일 압축 해제 완료", 3000), vacuum=True)
+
+    def _run_maintenance(self, title, method, done, **kwargs):
+        # 큰 DB의 VACUUM은 오래 걸리므로 작업 스레드에서 (끝나면 외부 변경 감지가 리스트를 다시 읽음)
+        task = MaintenanceTask(self.db_path, method, **kwargs)
+        # 압축/VACUUM 동안 DB 쓰기(저장/삭제/불러오기)를 막음 - 잠금 대기 시간을 넘겨 저장이 실패하지 않게
+        busy = (*self._maintenance_actions, self.btn_save, self.btn_delete, self.btn_import)
+        for w in busy: w.setEnabled(False)
+        def finish():
+            for w in busy: w.setEnabled(True)
+        task.signals.finished.connect(lambda n: (finish(), done(n)))
+        task.signals.failed.connect(lambda msg: (finish(), QMessageBox.critical(self, "오류", f"{title} 중 오류: {msg}")))
+        self._maintenance_signals = task.signals  # 작업이 끝날 때까지 시그널 객체 유지
+        QThreadPool.globalInstance().start(task)
+        self.statusBar().showMessage(f"{title} 진행 중... (완료될 때까지 저장/삭제/불러오기는 잠시 꺼 둡니다)")
+
     # ===== Excel Import/Export =====
     def on_import_excel(self):
         path, _ = QFileDialog.getOpenFileName(self, "엑셀 파일 선택 (DB '완전 대체')", "", "Excel Files (*.xlsx *.xls)")
@@ -622,8 +1986,7 @@ class MainWindow(QMainWindow):
             import pandas as pd
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = os.path.join(os.path.dirname(path) or os.getcwd(), f"Daily_Log_backup_{ts}.xlsx")
-            data = self._to_dataframe()
-            df = pd.DataFrame(data, columns=["날짜", "Daily Log", "주식 거래내역", "남은 주식 수(증권사별)", "주식 고려사항", "관심 주"])
+            df = self._to_dataframe()
             with pd.ExcelWriter(backup_path, engine="openpyxl") as w:
                 df.to_excel(w, sheet_name="Daily Log-From July 21", index=False)
         except Exception as e:
@@ -631,7 +1994,7 @@ class MainWindow(QMainWindow):
         try:
             self.db.wipe_all()
             self._import_excel_to_db(path, sheet_name="Daily Log-From July 21")
-            self.refresh_table(); self.refresh_calendar_marks()
+            self.refresh_table(); self.refresh_calendar_marks(); self._refresh_watchlist()
             QMessageBox.information(self, "완료", "엑셀 파일 내용으로 전체 리스트를 완전히 대체했습니다.")
             self.statusBar().showMessage("엑셀 불러오기(전체 대체) 완료", 2000)
         except Exception as e:
@@ -696,8 +2059,7 @@ class MainWindow(QMainWindow):
         if not path: return
         try:
             import pandas as pd
-            df = pd.DataFrame(self._to_dataframe(),
-                              columns=["날짜", "Daily Log", "주식 거래내역", "남은 주식 수(증권사별)", "주식 고려사항", "관심 주"])
+            df = self._to_dataframe()
             with pd.ExcelWriter(path, engine="openpyxl") as w:
                 df.to_excel(w, sheet_name="Daily Log-From July 21", index=False)
             QMessageBox.information(self, "내보내기 완료", f"저장됨: {path}")
@@ -705,17 +2067,23 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "오류", f"내보내기 중 오류: {e}")
 
     def _to_dataframe(self):
-        rows = self.db.get_all()
-        data = []
-        for r in rows:
-            data.append({
-                "날짜": r[1], "Daily Log": r[2], "주식 거래내역": r[3],
-                "남은 주식 수(증권사별)": r[4], "주식 고려사항": r[5], "관심 주": r[6]
-            })
-        return data
+        # 중간 dict 리스트 없이 행 레코드에서 바로 DataFrame 생성 (압축된 텍스트는 여기서 풂)
+        import pandas as pd
+        return pd.DataFrame.from_records((r[1:] for r in self.db.get_all()), columns=HEADERS)
 
     # ===== Theming =====
+    _theme_cache = {}  # light_mode → (qss, palette), 테마별로 한 번만 생성
+
     def apply_theme(self, light_mode=True):
+        cached = MainWindow._theme_cache.get(light_mode)
+        if cached is None:
+            cached = MainWindow._theme_cache[light_mode] = (self._build_stylesheet(light_mode), self._build_palette(light_mode))
+        qss, pal = cached
+        self.setStyleSheet(qss)
+        self.setPalette(pal)
+
+    @staticmethod
+    def _build_stylesheet(light_mode=True):
         if light_mode:
             primary = BRAND_PRIMARY
             topbar_bg = BRAND_PRIMARY
@@ -755,9 +2123,9 @@ class MainWindow(QMainWindow):
         QWidget#TopBar QLabel#AppTitle {{ color:{topbar_text}; font-family:'{FONT_FAMILY}'; font-size:{FONT_SIZE_PT+5}pt; font-weight:800; }}
         QWidget#TopBar QLabel#AppSubtitle {{ background-color: {topbar_bg}; padding: 4px 8px; border-radius: 4px; color: #FFFFFF; font-family: '{FONT_FAMILY}'; font-size: {FONT_SIZE_PT+2}pt; font-weight: bold; margin-left: 8px; letter-spacing: 0.5px; }}
 
-        QTableWidget {{ background:{card_bg}; border:1px solid {border_col}; border-radius:12px; gridline-color:{border_col};
+        QTableView {{ background:{card_bg}; border:1px solid {border_col}; border-radius:12px; gridline-color:{border_col};
                         alternate-background-color:{alt_bg}; selection-background-color:{table_sel}; selection-color:{selection_color}; padding:8px; }}
-        QTableWidget::item {{ padding:6px; }}
+        QTableView::item {{ padding:6px; }}
 
         /* Calendar */
         QCalendarWidget QWidget {{ alternate-background-color:{alt_bg}; background:{card_bg}; color:{text_col}; }}
@@ -767,8 +2135,8 @@ class MainWindow(QMainWindow):
         QCalendarWidget QMenu {{ background:{header_bg}; color:{header_text}; border:1px solid {border_col}; }}
 
         /* Inputs */
-        QLineEdit, QTextEdit, QDateEdit {{ background:{card_bg}; border:1px solid {btn_border}; border-radius:7px; padding:4px 6px; color:{text_col}; }}
-        QLineEdit:focus, QTextEdit:focus, QDateEdit:focus {{ border-color:{primary}; }}
+        QLineEdit, QTextEdit, QDateEdit, QComboBox {{ background:{card_bg}; border:1px solid {btn_border}; border-radius:7px; padding:4px 6px; color:{text_col}; }}
+        QLineEdit:focus, QTextEdit:focus, QDateEdit:focus, QComboBox:focus {{ border-color:{primary}; }}
         QDateEdit::drop-down {{ width:18px; }}
         QDateEdit::down-arrow {{ width:10px; height:10px; }}
         QLineEdit#search_edit {{ min-width: 300px; padding: 6px 12px; }}
@@ -802,9 +2170,11 @@ class MainWindow(QMainWindow):
 
         *:focus {{ outline:2px solid {primary}33; outline-offset:1px; }}
         """
-        self.setStyleSheet(qss)
+        return qss
 
-        pal = self.palette()
+    @staticmethod
+    def _build_palette(light_mode=True):
+        pal = QPalette(QApplication.palette())
         if light_mode:
             pal.setColor(QPalette.Window, QColor("#F5F7FA"))
             pal.setColor(QPalette.WindowText, QColor("#111827"))
@@ -823,11 +2193,29 @@ class MainWindow(QMainWindow):
             pal.setColor(QPalette.ButtonText, QColor("#FFFFFF"))
             pal.setColor(QPalette.Highlight, QColor("#60A5FA"))
             pal.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
-        self.setPalette(pal)
+        return pal
 
 # --- main entry point ---
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    ap = argparse.ArgumentParser(description="DailyLog Desktop")
+    ap.add_argument("--serve", action="store_true", help="GUI 없이 로컬 JSON/HTTP API 서버 실행")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--db", default=os.path.join(os.getcwd(), "daily_log.db"))
+    ap.add_argument("--report", nargs=2, metavar=("FROM", "TO"), help="GUI 없이 기간 보고서(HTML/PDF) 생성 (YYYY-MM-DD)")
+    ap.add_argument("--out", default="Daily_Log_Report", help="보고서 파일 이름 (확장자 제외)")
+    args, qt_argv = ap.parse_known_args()
+    if args.report:
+        # normalize_date는 잘못된 날짜를 오늘로 바꾸므로 엄격하게 검사 (오류 시 종료 코드 2)
+        try: date_from, date_to = (_api_date(s) for s in args.report)
+        except ValueError as e: ap.error(str(e))
+        if date_from > date_to: ap.error(f"FROM({date_from})이 TO({date_to})보다 늦습니다")
+        run_report(args.db, date_from, date_to, args.out)
+        sys.exit(0)
+    if args.serve:
+        run_server(args.db, args.host, args.port)
+        sys.exit(0)
+    app = QApplication(sys.argv[:1] + qt_argv)
     win = MainWindow()
     win.show()
     sys.exit(app.exec())
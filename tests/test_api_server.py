@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""로컬 API 서버 - 임시 DB + port 0으로 오프라인 테스트"""
+
+import os, sys, json, socket, sqlite3, asyncio, threading, http.client
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+N_DAYS = 1200  # API_STREAM_CHUNK(500)보다 많게 → 여러 배치로 스트리밍
+
+@pytest.fixture
+def server(tmp_path):
+    db_path = str(tmp_path / "api.db")
+    db = main.DailyLogDB(db_path)
+    start = date(2020, 1, 1)
+    for i in range(N_DAYS):
+        iso = (start + timedelta(days=i)).isoformat()
+        db.overwrite(iso, main.date_label_of(iso), {"daily_log": f"day {i}", "trades": "", "holdings": "",
+                                                    "considerations": "", "interests": "✅ 키움증권"})
+    db.close()
+
+    srv = main.DailyLogServer(db_path, port=0, pool_size=2)
+    loop = asyncio.new_event_loop()
+    port = loop.run_until_complete(srv.start())
+    t = threading.Thread(target=loop.run_forever, daemon=True); t.start()
+    yield srv, port
+    asyncio.run_coroutine_threadsafe(srv.close(), loop).result(10)
+    loop.call_soon_threadsafe(loop.stop); t.join(10); loop.close()
+
+def request(port, method, path, body=None, headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    conn.request(method, path, body=data, headers=headers or {})
+    resp = conn.getresponse()
+    raw = resp.read(); conn.close()
+    return resp.status, resp.headers, (json.loads(raw) if raw else None)
+
+def test_get_entry_and_304(server):
+    _, port = server
+    status, hdrs, row = request(port, "GET", "/entries/2020-01-02")
+    assert status == 200 and row["daily_log"] == "day 1" and hdrs["ETag"]
+    status, _, body = request(port, "GET", "/entries/2020-01-02", headers={"If-None-Match": hdrs["ETag"]})
+    assert status == 304 and body is None
+    assert request(port, "GET", "/entries/1990-01-01")[0] == 404
+    assert request(port, "GET", "/entries/2020-99-01")[0] == 400
+
+def test_if_match_412(server):
+    _, port = server
+    _, hdrs, _ = request(port, "GET", "/entries/2020-01-03")
+    status, new_hdrs, row = request(port, "POST", "/entries/2020-01-03?mode=overwrite",
+                                    {"daily_log": "edited"}, {"If-Match": hdrs["ETag"]})
+    assert status == 200 and row["daily_log"] == "edited" and new_hdrs["ETag"] != hdrs["ETag"]
+    status, _, _ = request(port, "POST", "/entries/2020-01-03?mode=overwrite",
+                           {"daily_log": "stale"}, {"If-Match": hdrs["ETag"]})
+    assert status == 412
+    assert request(port, "GET", "/entries/2020-01-03")[2]["daily_log"] == "edited"
+
+def test_streamed_ranges(server):
+    _, port = server
+    status, hdrs, rows = request(port, "GET", "/entries")
+    assert status == 200 and hdrs["Transfer-Encoding"] == "chunked"
+    dates = [r["date_iso"] for r in rows]
+    assert len(dates) == N_DAYS and dates == sorted(dates, reverse=True)
+    _, _, rows = request(port, "GET", "/entries?from=2020-02-01&to=2020-02-29")
+    assert [r["date_iso"] for r in rows][::-1] == [f"2020-02-{d:02d}" for d in range(1, 30)]
+    _, _, rows = request(port, "GET", "/entries?before=2022-01-01&limit=700")
+    assert len(rows) == 700 and rows[0]["date_iso"] == "2021-12-31"
+    status, _, _ = request(port, "GET", "/entries", headers={"If-None-Match": hdrs["ETag"]})
+    assert status == 304
+    _, _, rows = request(port, "GET", "/search?q=" + "ㅋㅇ&limit=3".replace("ㅋㅇ", "%E3%85%8B%E3%85%87"))
+    assert len(rows) == 3
+
+def test_stalled_readers_do_not_block_pool(server):
+    # 응답을 읽지 않는 스트리밍 클라이언트가 풀 크기보다 많아도 다른 요청은 처리되어야 함
+    _, port = server
+    stalled = []
+    for _ in range(4):
+        s = socket.create_connection(("127.0.0.1", port))
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        s.sendall(b"GET /entries HTTP/1.1\r\nHost: x\r\n\r\n"); stalled.append(s)
+    try:
+        assert request(port, "GET", "/entries?limit=1")[0] == 200
+        assert request(port, "GET", "/entries/2020-01-01")[0] == 200
+    finally:
+        for s in stalled: s.close()
+
+def test_bad_content_length(server):
+    _, port = server
+    s = socket.create_connection(("127.0.0.1", port), timeout=10)
+    s.sendall(b"POST /entries/2020-01-01 HTTP/1.1\r\nHost: x\r\nContent-Length: abc\r\n\r\n")
+    assert s.recv(4096).startswith(b"HTTP/1.1 400")
+    s.close()
+
+def test_range_etag_sees_older_updated_at(server):
+    # 시계가 늦은 기기가 최신이 아닌 행을 고침 → 건수/최신 updated_at은 그대로여도 304가 아니어야 함
+    srv, port = server
+    _, hdrs, _ = request(port, "GET", "/entries?from=2020-01-01&to=2020-01-31")
+    conn = sqlite3.connect(srv.db_path)
+    conn.execute("UPDATE entries SET daily_log='from a slow clock', updated_at='2000-01-01 00:00:00.000' WHERE date_iso='2020-01-10'")
+    conn.commit(); conn.close()
+    status, new_hdrs, rows = request(port, "GET", "/entries?from=2020-01-01&to=2020-01-31",
+                                     headers={"If-None-Match": hdrs["ETag"]})
+    assert status == 200 and new_hdrs["ETag"] != hdrs["ETag"]
+    assert {r["date_iso"]: r["daily_log"] for r in rows}["2020-01-10"] == "from a slow clock"
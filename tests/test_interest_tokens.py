@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""관심 주 토크나이저 - 종목 이름/티커/종목코드만 워치리스트로"""
+
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from main import extract_interest_tokens
+
+def test_note_words_after_ticker_are_dropped():
+    assert extract_interest_tokens("⭐ 강조 NVDA 목표가 상향") == {("NVDA", "⭐")}
+
+def test_markers_and_items():
+    assert extract_interest_tokens("✅ 관심주 삼성전자, SK하이닉스 ⭐ 키움증권") == {
+        ("삼성전자", "✅"), ("SK하이닉스", "✅"), ("키움증권", "⭐")}
+    assert extract_interest_tokens("nvda / tsla") == {("NVDA", ""), ("TSLA", "")}
+
+def test_symbols_following_a_name():
+    assert extract_interest_tokens("✅ 삼성전자(005930) 10주 매수 검토") == {("삼성전자", "✅"), ("005930", "✅")}
+    assert extract_interest_tokens("⭐ NVDA AMD TSLA 반도체 묶음") == {("NVDA", "⭐"), ("AMD", "⭐"), ("TSLA", "⭐")}
+    assert extract_interest_tokens("✅ BRK.B 장기") == {("BRK.B", "✅")}
+
+def test_quantities_and_empty():
+    assert extract_interest_tokens("✅ 10주 75.5") == set()
+    assert extract_interest_tokens("") == set()
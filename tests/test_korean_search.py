@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""자모/초성 검색 - 초성 검색어는 음절 경계를 넘어 매칭되지 않아야 함"""
+
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+
+EMPTY = {"trades": "", "holdings": "", "considerations": "", "interests": ""}
+
+def make_db(tmp_path):
+    db = main.DailyLogDB(str(tmp_path / "search.db"))
+    for iso, text in [("2025-01-01", "키움증권 매수"), ("2025-01-02", "해 질 녘에 산책"), ("2025-01-03", "키움 배당"),
+                      ("2025-01-04", "이렇게 했다"), ("2025-01-06", "하는 중")]:
+        db.overwrite(iso, main.date_label_of(iso), dict(EMPTY, daily_log=text))
+    return db
+
+def test_choseong_query_matches_initials_only(tmp_path):
+    db = make_db(tmp_path)
+    assert [r[0] for r in db.get_all("ㅋㅇ")] == ["2025-01-03", "2025-01-01"]
+    assert [r[0] for r in db.get_all("키우")] == ["2025-01-03", "2025-01-01"]
+    assert [r[0] for r in db.get_all("녘에")] == ["2025-01-02"]
+    assert [r[0] for r in db.get_all("ㅋㅇ", "2025-01-02", "2025-01-03")] == ["2025-01-03"]
+    db.close()
+
+def test_final_consonant_does_not_cross_syllables(tmp_path):
+    db = make_db(tmp_path)
+    assert [r[0] for r in db.get_all("일")] == []
+    assert [r[0] for r in db.get_all("한")] == []
+    assert [r[0] for r in db.get_all("이렇")] == ["2025-01-04"]
+    assert [r[0] for r in db.get_all("하느")] == ["2025-01-06"]
+    db.close()
+
+def test_match_spans():
+    assert main.match_spans("키움증권 녘에", "ㅋㅇ") == [(0, 2)]
+    assert main.match_spans("키움증권 녘에", "녘에") == [(5, 7)]
+    assert main.match_spans("키움증권", "키우") == [(0, 2)]
+    assert main.match_spans("이렇게 했다", "일") == []